@@ -94,7 +94,7 @@ class AutomatedPodcastPublisher:
             
             # Upload file
             logger.info(f"📤 Uploading {filename} to Firebase Storage...")
-            blob.upload_from_filename(audio_path, content_type='audio/mpeg')
+            self._upload_audio_blob(blob, audio_path)
             
             # Make public
             blob.make_public()
@@ -116,6 +116,33 @@ class AutomatedPodcastPublisher:
             logger.warning("   3. Use SoundCloud, Archive.org, or podcast hosting")
             return None
     
+    def _upload_audio_blob(self, blob, audio_path: str):
+        """Upload an MP3 to blob, in parallel 8 MB slices when the file is large
+        
+        Long episodes go through transfer_manager.upload_chunks_concurrently (XML
+        multipart upload, google-cloud-storage >= 2.10) on worker threads: the
+        upload is I/O-bound and this may already run inside a thread pool, where
+        forking or spawning processes is unsafe. Anything smaller, an older
+        library or a failed chunked upload uses a plain single-stream upload.
+        """
+        chunk_size = 8 << 20
+        if os.path.getsize(audio_path) > 2 * chunk_size:
+            try:
+                from google.cloud.storage import transfer_manager
+                upload_chunks = transfer_manager.upload_chunks_concurrently
+                thread_workers = transfer_manager.THREAD
+            except (ImportError, AttributeError):
+                upload_chunks = None
+            if upload_chunks is not None:
+                try:
+                    upload_chunks(
+                        audio_path, blob, content_type='audio/mpeg', chunk_size=chunk_size,
+                        worker_type=thread_workers, max_workers=4)
+                    return
+                except Exception as e:
+                    logger.warning(f"Chunked upload failed, retrying as a single upload: {e}")
+        blob.upload_from_filename(audio_path, content_type='audio/mpeg')
+    
     def add_episode_to_rss(self, audio_url: str, title: str, description: str,
                           pub_date: Optional[datetime] = None, duration: int = 0):
         """Add new episode to RSS feed
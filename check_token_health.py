@@ -14,9 +14,11 @@ Usage:
 """
 
 import json
-import requests
+from http_session import make_session
 from datetime import datetime, timedelta
 
+_SESSION = make_session()
+
 def check_token_health():
     """Check the health of the Facebook token"""
     
@@ -44,7 +46,7 @@ def check_token_health():
     print("🧪 Test 1: Token Validity")
     try:
         test_url = f"https://graph.facebook.com/v18.0/{page_id}"
-        test_response = requests.get(test_url, params={'access_token': token})
+        test_response = _SESSION.get(test_url, params={'access_token': token})
         
         if test_response.status_code == 200:
             page_data = test_response.json()
@@ -68,7 +70,7 @@ def check_token_health():
     print("🧪 Test 2: Token Expiration")
     try:
         debug_url = "https://graph.facebook.com/v18.0/debug_token"
-        debug_response = requests.get(debug_url, params={
+        debug_response = _SESSION.get(debug_url, params={
             'input_token': token,
             'access_token': token
         })
@@ -119,7 +121,7 @@ def check_token_health():
             'published': False  # Create as draft, don't publish
         }
         
-        post_response = requests.post(test_post_url, data=test_payload)
+        post_response = _SESSION.post(test_post_url, data=test_payload)
         
         if post_response.status_code == 200:
             print("   ✅ Token has POSTING permission")
@@ -127,7 +129,7 @@ def check_token_health():
             post_id = post_response.json().get('id')
             if post_id:
                 delete_url = f"https://graph.facebook.com/v18.0/{post_id}"
-                requests.delete(delete_url, params={'access_token': token})
+                _SESSION.delete(delete_url, params={'access_token': token})
         else:
             error_data = post_response.json()
             error_msg = error_data.get('error', {}).get('message', 'Unknown error')
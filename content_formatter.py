@@ -3,11 +3,33 @@ Content Formatter for Social Media
 Formats Italian pizzini content for different social media platforms
 """
 
+import functools
 import re
 import hashlib
 from typing import List, Dict, Tuple
 from datetime import datetime
 
+@functools.lru_cache(maxsize=16)
+def _clean_content(content: str) -> str:
+    """Clean and prepare content for social media
+    
+    Pure (unlike hashtag selection, which tracks used tags), so one post formatted
+    for several platforms cleans its content once.
+    """
+    # Remove excessive whitespace
+    cleaned = re.sub(r'\s+', ' ', content.strip())
+    
+    # Fix punctuation spacing
+    cleaned = re.sub(r'\s*([.!?])\s*', r'\1 ', cleaned)
+    
+    # Remove any XML artifacts
+    cleaned = re.sub(r'<[^>]+>', '', cleaned)
+    
+    # Handle quotes properly
+    cleaned = cleaned.replace('«', '"').replace('»', '"')
+    
+    return cleaned
+
 class ContentFormatter:
     """Formats content for various social media platforms"""
     
@@ -247,19 +269,7 @@ class ContentFormatter:
     
     def _clean_content(self, content: str) -> str:
         """Clean and prepare content for social media"""
-        # Remove excessive whitespace
-        cleaned = re.sub(r'\s+', ' ', content.strip())
-        
-        # Fix punctuation spacing
-        cleaned = re.sub(r'\s*([.!?])\s*', r'\1 ', cleaned)
-        
-        # Remove any XML artifacts
-        cleaned = re.sub(r'<[^>]+>', '', cleaned)
-        
-        # Handle quotes properly
-        cleaned = cleaned.replace('«', '"').replace('»', '"')
-        
-        return cleaned
+        return _clean_content(content)
     
     def _select_hashtags(self, content: str, platform: str, max_count: int) -> List[str]:
         """Select appropriate hashtags based on content and platform"""
@@ -4,9 +4,12 @@ Firebase Setup Script for Pizzini Automation
 Uploads configuration and XML content to Firebase
 """
 
+import gzip
 import json
+import shutil
 import sys
 import os
+import tempfile
 from firebase_admin import initialize_app, firestore, storage, credentials
 import argparse
 
@@ -49,9 +52,17 @@ def upload_xml_content(xml_file='pizzini.xml'):
         # Use explicit bucket to avoid default appspot bucket mismatch
         bucket = storage.bucket('pizzini-91da9')
         blob = bucket.blob('pizzini.xml')
+        # XML compresses ~8-10x: store it gzip-encoded (readers get it decompressed
+        # transparently) and send it in resumable 8 MB chunks
+        blob.content_encoding = 'gzip'
+        blob.chunk_size = 8 * 1024 * 1024
         
-        with open(xml_file, 'r', encoding='utf-8') as f:
-            blob.upload_from_string(f.read(), content_type='application/xml')
+        # Compress while streaming from disk; the buffer only spills to a temp file
+        # above 64 MB, so the XML is never held in memory as one string
+        with tempfile.SpooledTemporaryFile(max_size=64 << 20) as buf:
+            with open(xml_file, 'rb') as f, gzip.GzipFile(fileobj=buf, mode='wb') as gz:
+                shutil.copyfileobj(f, gz)
+            blob.upload_from_file(buf, content_type='application/xml', rewind=True)
         
         print("✅ XML content uploaded to Firebase Storage")
         return True
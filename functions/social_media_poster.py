@@ -10,6 +10,7 @@ Handles posting to X (Twitter) and Instagram with proper formatting
 import tweepy
 import instagrapi
 from typing import Optional, Dict, Any, List
+import functools
 import os
 import logging
 from datetime import datetime
@@ -609,22 +610,26 @@ class ImageGenerator:
         self.text_color = (51, 51, 51)  # Dark gray text
         self.accent_color = (74, 144, 226)  # Blue accent
     
-    def create_quote_image(self, title: str, content: str, date: str = "", save_path: str = "temp_post.png") -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _load_font(path: str, size: int):
+        """Load a TrueType font once per (path, size), falling back to PIL's default font"""
+        try:
+            return ImageFont.truetype(path, size)
+        except OSError:
+            return ImageFont.load_default()
+    
+    def create_quote_image(self, title: str, content: str, date: str = "", save_path: str = "temp_post.jpg") -> str:
         """Create a quote image for Instagram/X"""
         try:
             # Create image
             img = Image.new('RGB', (self.width, self.height), self.background_color)
             draw = ImageDraw.Draw(img)
             
-            # Try to load a nice font, fallback to default
-            try:
-                title_font = ImageFont.truetype("arial.ttf", 48)
-                content_font = ImageFont.truetype("arial.ttf", 32)
-                date_font = ImageFont.truetype("arial.ttf", 24)
-            except:
-                title_font = ImageFont.load_default()
-                content_font = ImageFont.load_default()
-                date_font = ImageFont.load_default()
+            # Try to load a nice font, fallback to default (cached across calls)
+            title_font = self._load_font("arial.ttf", 48)
+            content_font = self._load_font("arial.ttf", 32)
+            date_font = self._load_font("arial.ttf", 24)
             
             # Calculate margins
             margin = 80
@@ -664,7 +669,9 @@ class ImageGenerator:
                 draw.text((date_x, date_y), date, font=date_font, fill=self.text_color)
             
             # Save image
-            img.save(save_path, 'PNG', quality=95)
+            # JPEG: the card is opaque and platforms re-encode to JPEG anyway; PNG's
+            # deflate is the slowest encoder in Pillow (and ignores 'quality')
+            img.save(save_path, 'JPEG', quality=90, subsampling=2, optimize=False)
             logger.info(f"Generated image saved to {save_path}")
             return save_path
             
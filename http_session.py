@@ -0,0 +1,26 @@
+"""
+Shared HTTP session setup for the maintenance scripts
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def make_session(pool_size: int = 4) -> requests.Session:
+    """Return a keep-alive requests session with backoff retries on 429/5xx
+
+    urllib3 only retries idempotent methods by default, so POSTs (posts, alerts,
+    config uploads) are never sent twice. Once the retries run out the last
+    response is returned as-is, so callers still see its status code and error body.
+
+    Args:
+        pool_size: Keep-alive connections kept per host
+    """
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                          raise_on_status=False)
+    ))
+    return session
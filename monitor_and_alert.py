@@ -26,11 +26,13 @@ Setup as Windows Task:
 """
 
 import json
-import requests
+from http_session import make_session
 from datetime import datetime, timedelta
 import os
 import platform
 
+_SESSION = make_session()
+
 # Try to import Windows toast notifications
 try:
     from win10toast import ToastNotifier
@@ -57,7 +59,7 @@ def check_and_alert():
         
         # Check token
         debug_url = "https://graph.facebook.com/v18.0/debug_token"
-        debug_response = requests.get(debug_url, params={
+        debug_response = _SESSION.get(debug_url, params={
             'input_token': token,
             'access_token': token
         })
@@ -291,7 +293,7 @@ Time: {datetime.now().strftime('%Y-%m-%d %H:%M')}
             'access_token': token
         }
         
-        response = requests.post(send_url, json=message_data)
+        response = _SESSION.post(send_url, json=message_data)
         
         if response.status_code == 200:
             print("📱 Facebook Messenger alert sent!")
@@ -2,6 +2,7 @@
 Voice Preview Tool - Test all available Italian voices for Pizzini
 Generates sample audio with each voice so you can choose your favorite old priest voice
 """
+import logging
 import os
 import sys
 from social_media_poster import AudioGenerator
@@ -122,6 +123,8 @@ def show_help():
 
 
 if __name__ == "__main__":
+    # social_media_poster only attaches a NullHandler; show TTS warnings and errors here
+    logging.basicConfig(level=logging.INFO)
     if len(sys.argv) > 1:
         if sys.argv[1] in ['--help', '-h', 'help']:
             show_help()
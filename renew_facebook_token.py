@@ -10,9 +10,11 @@ Usage:
 """
 
 import json
-import requests
+from http_session import make_session
 from datetime import datetime
 
+_SESSION = make_session()
+
 print("=" * 70)
 print("🔄 FACEBOOK TOKEN RENEWAL ASSISTANT")
 print("=" * 70)
@@ -33,7 +35,7 @@ print()
 print("🧪 Testing current token...")
 try:
     test_url = f"https://graph.facebook.com/v18.0/{page_id}"
-    test_response = requests.get(test_url, params={'access_token': current_token})
+    test_response = _SESSION.get(test_url, params={'access_token': current_token})
     
     if test_response.status_code == 200:
         print("✅ Current token is VALID!")
@@ -42,7 +44,7 @@ try:
         
         # Check token info
         debug_url = f"https://graph.facebook.com/v18.0/debug_token"
-        debug_response = requests.get(debug_url, params={
+        debug_response = _SESSION.get(debug_url, params={
             'input_token': current_token,
             'access_token': current_token
         })
@@ -119,7 +121,7 @@ print("🧪 Testing new token...")
 try:
     # Test basic access
     test_url = f"https://graph.facebook.com/v18.0/{page_id}"
-    test_response = requests.get(test_url, params={'access_token': new_token})
+    test_response = _SESSION.get(test_url, params={'access_token': new_token})
     
     if test_response.status_code != 200:
         print("❌ Token test failed!")
@@ -145,7 +147,7 @@ try:
         'published': False  # Create as draft
     }
     
-    post_response = requests.post(test_post_url, data=test_payload)
+    post_response = _SESSION.post(test_post_url, data=test_payload)
     
     if post_response.status_code == 200:
         print("   ✅ Token has POSTING permission!")
@@ -161,7 +163,7 @@ try:
     
     # Get token expiration info
     debug_url = f"https://graph.facebook.com/v18.0/debug_token"
-    debug_response = requests.get(debug_url, params={
+    debug_response = _SESSION.get(debug_url, params={
         'input_token': new_token,
         'access_token': new_token
     })
@@ -205,7 +207,7 @@ try:
     project_id = "pizzini-91da9"
     function_url = f"https://us-central1-{project_id}.cloudfunctions.net/update_config"
     
-    response = requests.post(function_url, json=config, headers={'Content-Type': 'application/json'})
+    response = _SESSION.post(function_url, json=config, headers={'Content-Type': 'application/json'})
     
     if response.status_code == 200:
         result = response.json()
@@ -234,7 +236,7 @@ try:
     
     print(f"   Posting: '{test_message}'")
     
-    response = requests.post(test_url, data=test_payload)
+    response = _SESSION.post(test_url, data=test_payload)
     
     if response.status_code == 200:
         result = response.json()
@@ -4,6 +4,13 @@ import sys
 from typing import List, Optional, Tuple
 import xml.etree.ElementTree as ET
 
+# ElementTree silently falls back to its pure-Python implementation when the
+# _elementtree C accelerator is missing, which is roughly 10x slower on large files.
+_HAS_C_ACCELERATOR = ET.Element is getattr(sys.modules.get("_elementtree"), "Element", None)
+
+_QUOTE_CHARS = " \u00AB\u00BB\"'“”‘’»«"
+_TITLE_STRIP_CHARS = " .,:;" + _QUOTE_CHARS[1:]
+
 
 def normalize_text(s: str) -> str:
     s = s.strip()
@@ -13,7 +20,7 @@ def normalize_text(s: str) -> str:
     s = re.sub(r"[\r\n\t]+", " ", s)
     s = re.sub(r"\s{2,}", " ", s)
     # Trim leading/ending quotes and guillemets
-    s = s.strip(" \u00AB\u00BB\"'“”‘’»«")
+    s = s.strip(_QUOTE_CHARS)
     return s.strip()
 
 
@@ -22,6 +29,7 @@ GENERIC_PREFIXES = [
     "PIZZINO DELLA SETTIMANA",
     "PIZZINO DI PROVA",
 ]
+_GENERIC_PREFIXES_UPPER = tuple(p.upper() for p in GENERIC_PREFIXES)
 
 
 ROMAN_NUM = r"I|II|III|IV|V|VI|VII|VIII|IX|X|XI|XII"
@@ -31,7 +39,7 @@ ITALIAN_NUM = r"UNO|DUE|TRE|QUATTRO|CINQUE|SEI|SETTE|OTTO|NOVE|DIECI"
 def clean_title(t: str) -> str:
     t = t.strip()
     # Trim dangling punctuation/quotes
-    t = t.strip(" .,:;\u00AB\u00BB\"'“”‘’»«")
+    t = t.strip(_TITLE_STRIP_CHARS)
     # Compress inner spaces
     t = re.sub(r"\s{2,}", " ", t)
     return t
@@ -42,7 +50,7 @@ def is_all_caps_block(s: str) -> bool:
     return bool(re.fullmatch(r"[A-ZÀ-ÖØ-Ý'’\s().0-9°ª-]+", s))
 
 
-_TRIVIAL_WORDS = {
+_TRIVIAL_WORDS = frozenset({
     "IL",
     "LA",
     "LO",
@@ -55,12 +63,15 @@ _TRIVIAL_WORDS = {
     "UN",
     "UNO",
     "UNA",
-}
+})
+_TRIVIAL_MAX_LEN = max(len(w) for w in _TRIVIAL_WORDS)
 
 
-def polish_candidate(title: str) -> str:
-    """Post-process derived title to fix glued words and drop trivial tokens."""
-    s = clean_title(title)
+def polish_candidate(title: str, already_clean: bool = False) -> str:
+    """Post-process derived title to fix glued words and drop trivial tokens.
+    Pass already_clean=True for slices of normalized text (spaces already
+    collapsed) to skip the clean_title regex pass."""
+    s = title.strip().strip(_TITLE_STRIP_CHARS) if already_clean else clean_title(title)
     # If starts with glued ALL-CAPS immediately followed by a lowercase sequence (e.g., TUTTOTutto), keep the ALL-CAPS token only
     # NOTE: Require the next character sequence to include at least one lowercase letter to avoid truncating
     # valid ALL-CAPS words followed by a space (e.g., 'ANCORA SUL ...').
@@ -70,7 +81,7 @@ def polish_candidate(title: str) -> str:
         if 3 <= len(caps) <= 60:
             s = caps
     # Remove solitary trivial words
-    if s.upper() in _TRIVIAL_WORDS:
+    if len(s) <= _TRIVIAL_MAX_LEN and s.upper() in _TRIVIAL_WORDS:
         return ""
     return s
 
@@ -110,16 +121,17 @@ def derive_title_from_content(content: str) -> Optional[str]:
     colon_pos = text.find(":")
     if 0 < colon_pos <= 140:
         pre = clean_title(text[:colon_pos])
-        post = normalize_text(text[colon_pos + 1 :])
-        if any(pre.upper().startswith(pfx.upper()) for pfx in GENERIC_PREFIXES):
+        # text is already normalized: only the leading quotes/spaces need trimming
+        post = text[colon_pos + 1 :].lstrip().lstrip(_QUOTE_CHARS).lstrip()
+        if pre.upper().startswith(_GENERIC_PREFIXES_UPPER):
             m_q = re.match(r"^([^\.!?]{5,120}?)[\?\.!]", post)
             if m_q:
-                cand = polish_candidate(m_q.group(1))
+                cand = polish_candidate(m_q.group(1), already_clean=True)
                 cand = _finalize_title(text, cand)
                 if 8 <= len(cand) <= 120:
                     return cand
         if 6 <= len(pre) <= 80 and not pre.endswith("…"):
-            cand = polish_candidate(pre)
+            cand = polish_candidate(pre, already_clean=True)
             cand = _finalize_title(text, cand)
             if cand and len(cand) >= 6:
                 return cand
@@ -136,7 +148,7 @@ def derive_title_from_content(content: str) -> Optional[str]:
         cand = _finalize_title(text, cand)
         # Validate caps block including parentheses
         if 5 <= len(cand) <= 80 and is_all_caps_block(main):
-            cand2 = polish_candidate(cand)
+            cand2 = polish_candidate(cand, already_clean=True)
             if cand2:
                 return cand2
 
@@ -167,7 +179,7 @@ def derive_title_from_content(content: str) -> Optional[str]:
                         head = head.rstrip()
                     caps_block = head
     if caps_block:
-        cand = polish_candidate(caps_block)
+        cand = polish_candidate(caps_block, already_clean=True)
         cand = _finalize_title(text, cand)
         if cand:
             return cand
@@ -177,7 +189,7 @@ def derive_title_from_content(content: str) -> Optional[str]:
     # 4) First sentence fallback
     m_sent = re.match(r"^([^\.!?]{8,90}?)\.?[!\?]", text)
     if m_sent:
-        cand = polish_candidate(m_sent.group(1))
+        cand = polish_candidate(m_sent.group(1), already_clean=True)
         cand = _finalize_title(text, cand)
         if len(cand) >= 6:
             return cand
@@ -186,7 +198,7 @@ def derive_title_from_content(content: str) -> Optional[str]:
     snippet = text[:60]
     if " " in snippet:
         snippet = snippet[: snippet.rfind(" ")]
-    cand = polish_candidate(snippet)
+    cand = polish_candidate(snippet, already_clean=True)
     cand = _finalize_title(text, cand)
     return cand if cand else None
 
@@ -208,14 +220,24 @@ def _build_title_regex(title: str) -> re.Pattern:
     # Build pattern: optional leading whitespace, exact title, require a word-boundary or separator/end
     # This avoids matching partial words (e.g., 'ANCOR' inside 'ANCORA').
     pat = rf"^\s*{t_esc}(?:\b|[\s\.:;–—-]|$)[\s\.:;–—-]*\s*"
-    return re.compile(pat, flags=re.IGNORECASE | re.UNICODE | re.MULTILINE)
+    return re.compile(pat, flags=re.IGNORECASE | re.UNICODE)
+
+
+_PROBE_SPLIT_RE = re.compile(r"[\s'’]")
 
 
 def strip_leading_heading_from_content(content: str, title: str) -> str:
     """If content begins with the given title (or superficial variants), strip it.
-    Returns possibly-updated content (original if no change)."""
+    Only the leading heading is removed: the title repeated at the start of a later
+    line is left alone. Returns possibly-updated content (original if no change)."""
     if not content or not title:
         return content
+    # Cheap literal prefilter before invoking the regex engine: the title's first
+    # word fragment (up to 6 chars, before any space/apostrophe that the pattern
+    # treats flexibly) must appear near the start of the content.
+    probe = _PROBE_SPLIT_RE.split(clean_title(title), maxsplit=1)[0][:6].lower()
+    if probe and probe not in content.lstrip()[:64].lower():
+        return content
     pattern = _build_title_regex(title)
     new = pattern.sub("", content, count=1)
     if new == content:
@@ -227,7 +249,7 @@ def strip_leading_heading_from_content(content: str, title: str) -> str:
         # Accept NBSP/thin spaces as whitespace; capture up to first sentence boundary
         ws = r"[\s\u00A0\u202F]+"
         extended_pat = rf"^\s*{t_esc}(?:{ws}\([^\)\n\r]{{1,80}}\))?(?:{ws}?[\-–—:]{1}\s*[^\.!?\n\r]{{1,80}})?[\s\.:;–—-]*\s*"
-        new2 = re.sub(extended_pat, "", content, count=1, flags=re.IGNORECASE|re.UNICODE|re.MULTILINE)
+        new2 = re.sub(extended_pat, "", content, count=1, flags=re.IGNORECASE|re.UNICODE)
         if new2 != content:
             new = new2
     # Also trim a single leading blank line left behind
@@ -236,10 +258,10 @@ def strip_leading_heading_from_content(content: str, title: str) -> str:
     return new
 
 
-def ensure_title_element(entry: ET.Element) -> Tuple[bool, Optional[str]]:
+def ensure_title_element(entry: ET.Element) -> Tuple[bool, Optional[str], str]:
     """Insert or fill the Title element based on Content.
     Also de-duplicates a leading heading from Content if it matches the Title.
-    Returns (changed, title)."""
+    Returns (changed, title, id_text)."""
     # Find child elements by tag name
     children = list(entry)
     tags = [ch.tag for ch in children]
@@ -249,9 +271,10 @@ def ensure_title_element(entry: ET.Element) -> Tuple[bool, Optional[str]]:
     date_el = entry.find("Date")
     title_el = entry.find("Title")
     content_el = entry.find("Content")
+    id_text = ((id_el.text if id_el is not None else None) or "?").strip()
 
     if content_el is None or (content_el.text or "").strip() == "":
-        return False, None
+        return False, None, id_text
 
     current_title = (title_el.text if title_el is not None and title_el.text else "").strip()
     content_text = content_el.text or ""
@@ -275,11 +298,11 @@ def ensure_title_element(entry: ET.Element) -> Tuple[bool, Optional[str]]:
                 title_el.text = current_title
                 changed = True
 
-        return changed, current_title
+        return changed, current_title, id_text
 
     derived = derive_title_from_content(content_text)
     if not derived:
-        return False, None
+        return False, None, id_text
 
     # Create Title element if missing
     if title_el is None:
@@ -301,7 +324,7 @@ def ensure_title_element(entry: ET.Element) -> Tuple[bool, Optional[str]]:
     if new_content != content_text:
         content_el.text = new_content.lstrip()
 
-    return True, derived
+    return True, derived, id_text
 
 
 def indent(elem: ET.Element, level: int = 0) -> None:
@@ -319,7 +342,9 @@ def indent(elem: ET.Element, level: int = 0) -> None:
 
 
 def process(input_path: str, output_path: str, dry_run: bool = False) -> int:
-    tree = ET.parse(input_path)
+    if not _HAS_C_ACCELERATOR:
+        print("Warning: _elementtree C accelerator unavailable; parsing will be slow", file=sys.stderr)
+    tree = ET.parse(input_path, parser=ET.XMLParser(encoding="utf-8"))
     root = tree.getroot()
 
     # Items are nested <pizzini> inside root <pizzini>
@@ -328,11 +353,9 @@ def process(input_path: str, output_path: str, dry_run: bool = False) -> int:
     derived_list: List[Tuple[str, Optional[str]]] = []
 
     for item in items:
-        changed, title = ensure_title_element(item)
+        changed, title, id_text = ensure_title_element(item)
         if changed:
             updated += 1
-        # Collect id for logging
-        id_text = (item.findtext("Id") or "?").strip()
         derived_list.append((id_text, title))
 
     # Post-pass: repair any existing numbered titles that still have appended sentence text
@@ -352,13 +375,14 @@ def process(input_path: str, output_path: str, dry_run: bool = False) -> int:
         indent(root)
         tree.write(output_path, encoding="utf-8", xml_declaration=True)
 
-    # Simple report to stdout
-    print(f"Processed {len(items)} items; added/updated titles: {updated}")
-    for pid, t in derived_list:
-        if t:
-            print(f"  Id {pid}: '{t}'")
-        else:
-            print(f"  Id {pid}: (unchanged or no content)")
+    # Simple report to stdout, emitted in one write (console writes are slow on Windows)
+    lines = [f"Processed {len(items)} items; added/updated titles: {updated}"]
+    lines.extend(
+        f"  Id {pid}: '{t}'" if t else f"  Id {pid}: (unchanged or no content)"
+        for pid, t in derived_list
+    )
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.write("\n")
 
     return updated
 
@@ -97,14 +97,16 @@ def _title_issues(title: str) -> List[str]:
 def validate(input_path: str = INPUT_XML) -> List[Dict[str, str]]:
     tree = ET.parse(input_path)
     root = tree.getroot()
-    # Find all pizzini entries (skip schema node)
-    items = root.findall('.//pizzini/pizzini') or [e for e in root.findall('.//pizzini') if e.find('Id') is not None]
-    # Deduplicate by Id if both patterns matched
+    # Single pass over all pizzini entries (skip schema/root nodes without an Id),
+    # deduplicating by Id on the fly
     seen = set()
     mismatches = []
 
-    for item in items:
-        id_text = (item.findtext("Id") or "?").strip()
+    for item in root.iter("pizzini"):
+        id_el = item.find("Id")
+        if id_el is None:
+            continue
+        id_text = (id_el.text or "?").strip()
         if id_text in seen:
             continue
         seen.add(id_text)
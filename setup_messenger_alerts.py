@@ -15,7 +15,9 @@ Usage:
 """
 
 import json
-import requests
+from http_session import make_session
+
+_SESSION = make_session()
 
 print("=" * 70)
 print("📱 FACEBOOK MESSENGER ALERT SETUP")
@@ -50,13 +52,17 @@ print()
 try:
     # Get conversations
     conversations_url = f"https://graph.facebook.com/v18.0/{page_id}/conversations"
-    conv_response = requests.get(conversations_url, params={
+    conv_response = _SESSION.get(conversations_url, params={
         'access_token': token,
         'fields': 'participants,messages{message,from}'
     })
+    try:
+        conv_body = conv_response.json()
+    except ValueError:
+        conv_body = {}
     
     if conv_response.status_code != 200:
-        error = conv_response.json().get('error', {})
+        error = conv_body.get('error', {})
         print(f"❌ Could not get conversations: {error.get('message', 'Unknown error')}")
         print()
         print("Possible issues:")
@@ -69,7 +75,7 @@ try:
         print("  3. Run: python renew_facebook_token.py")
         exit(1)
     
-    conversations = conv_response.json().get('data', [])
+    conversations = conv_body.get('data', [])
     
     if not conversations:
         print("❌ No conversations found!")
@@ -125,14 +131,18 @@ try:
         'access_token': token
     }
     
-    send_response = requests.post(send_url, json=message_data)
+    send_response = _SESSION.post(send_url, json=message_data)
+    try:
+        send_body = send_response.json()
+    except ValueError:
+        send_body = {}
     
     if send_response.status_code == 200:
         print("✅ TEST MESSAGE SENT!")
         print("   Check your Facebook Messenger - you should have received a message!")
         print()
     else:
-        error = send_response.json().get('error', {})
+        error = send_body.get('error', {})
         print(f"❌ Failed to send message: {error.get('message', 'Unknown error')}")
         print()
         print("Common issues:")
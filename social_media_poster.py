@@ -4,125 +4,364 @@ Handles posting to X (Twitter) and Instagram with proper formatting
 """
 
 from typing import Optional, Dict, Any, List
+import asyncio
+import contextlib
+import functools
+import hashlib
+import importlib.util
+import mimetypes
 import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 import re
 import logging
+import shutil
+import subprocess
 from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlencode
 from io import BytesIO
-from PIL import Image, ImageDraw, ImageFont
 from content_formatter import ContentFormatter
+from http_session import make_session
 import json
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Library module: leave logging configuration to the entry-point script
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
-try:
-    import tweepy
-    TWEEPY_AVAILABLE = True
-except ImportError:
-    TWEEPY_AVAILABLE = False
-    logger.info("tweepy not available - X/Twitter posting disabled. Install: pip install tweepy")
+# Heavy optional dependencies (tweepy, instagrapi, PIL and the TTS engines) are imported
+# where they are first used, so jobs that never post or speak don't pay for them (Coqui
+# alone pulls in torch). Availability is checked here without importing the package.
+def _module_available(name: str) -> bool:
+    """True if the module can be found (only its parent packages get imported)"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
 
-try:
-    import instagrapi
-    INSTAGRAPI_AVAILABLE = True
-except ImportError:
-    INSTAGRAPI_AVAILABLE = False
-    logger.info("instagrapi not available - Instagram posting disabled. Install: pip install instagrapi")
-
-# Try to import Azure Speech SDK
-try:
-    import azure.cognitiveservices.speech as speechsdk
-    AZURE_TTS_AVAILABLE = True
-except ImportError:
-    AZURE_TTS_AVAILABLE = False
+# Azure Speech SDK
+AZURE_TTS_AVAILABLE = _module_available("azure.cognitiveservices.speech")
+if not AZURE_TTS_AVAILABLE:
     logger.info("Azure TTS not available - using gTTS only")
 
-# Try to import Google Cloud Text-to-Speech (Neural2 - high quality)
-try:
-    from google.cloud import texttospeech as gcloud_tts
-    CLOUD_TTS_AVAILABLE = True
-except ImportError:
-    CLOUD_TTS_AVAILABLE = False
+# Google Cloud Text-to-Speech (Neural2 - high quality)
+CLOUD_TTS_AVAILABLE = _module_available("google.cloud.texttospeech")
+if not CLOUD_TTS_AVAILABLE:
     logger.info("Google Cloud TTS not available - install: pip install google-cloud-texttospeech")
 
-# Try to import Coqui TTS
-try:
-    from TTS.api import TTS as CoquiTTS
-    COQUI_TTS_AVAILABLE = True
-except ImportError:
-    COQUI_TTS_AVAILABLE = False
+# Coqui TTS
+COQUI_TTS_AVAILABLE = _module_available("TTS")
+if not COQUI_TTS_AVAILABLE:
     logger.info("Coqui TTS not available - install with: pip install TTS")
 
-# Try to import gTTS
-try:
-    from gtts import gTTS
-    GTTS_AVAILABLE = True
-except ImportError:
-    GTTS_AVAILABLE = False
+@functools.lru_cache(maxsize=None)
+def _coqui_tts_importable() -> bool:
+    """True if Coqui TTS actually imports, checked once on first use
+    
+    find_spec only shows the package is installed; a TTS install that fails to
+    import (broken torch, unsupported Python) must count as unavailable.
+    """
+    if not COQUI_TTS_AVAILABLE:
+        return False
+    try:
+        importlib.import_module("TTS.api")
+    except ImportError as e:
+        logger.warning(f"Coqui TTS is installed but failed to import: {e}")
+        return False
+    return True
+
+# gTTS
+GTTS_AVAILABLE = _module_available("gtts")
+if not GTTS_AVAILABLE:
     logger.info("gTTS not available - install with: pip install gTTS")
 
-# Try to import pydub for audio duration (optional)
-try:
-    from pydub import AudioSegment
-    PYDUB_AVAILABLE = True
-except (ImportError, ModuleNotFoundError):
-    PYDUB_AVAILABLE = False
-    logger.warning("pydub not fully compatible with Python 3.13 - audio duration will not be available")
+# mutagen for audio duration (optional; reads only the MP3 header, no decoding)
+MUTAGEN_AVAILABLE = _module_available("mutagen")
+if not MUTAGEN_AVAILABLE:
+    logger.info("mutagen not available - audio duration will not be available. Install: pip install mutagen")
+
+class RateLimiter:
+    """Per-host gate for outbound API calls made by SocialMediaManager.broadcast
+    
+    Each host gets a semaphore capping concurrent requests plus a sliding window of
+    recent request timestamps, so calls wait for a free slot instead of tripping the
+    platform's rate limit and paying for 429 backoff. Hosts without an entry are not limited.
+    """
+    
+    # host: (max requests, window in seconds)
+    DEFAULT_LIMITS = {
+        'graph.facebook.com': (200, 3600),
+        'api.twitter.com': (300, 900),
+        'i.instagram.com': (180, 3600),
+    }
+    
+    def __init__(self, limits: Optional[Dict[str, tuple]] = None, max_in_flight: int = 2):
+        self.limits = dict(self.DEFAULT_LIMITS if limits is None else limits)
+        self.max_in_flight = max_in_flight
+        # Timestamps outlive the event loop; semaphores are rebuilt per loop
+        self._calls: Dict[str, deque] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._loop = None
+    
+    @contextlib.asynccontextmanager
+    async def acquire(self, host: str):
+        """Hold a request slot for host for the duration of the block"""
+        limit = self.limits.get(host)
+        if limit is None:
+            yield
+            return
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._semaphores = {}
+            self._loop = loop
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._semaphores[host] = asyncio.Semaphore(self.max_in_flight)
+        async with semaphore:
+            await self._wait_for_slot(host, *limit)
+            yield
+    
+    async def _wait_for_slot(self, host: str, max_requests: int, window: float):
+        """Sleep until host has fewer than max_requests calls in the last window seconds"""
+        calls = self._calls.setdefault(host, deque())
+        while True:
+            now = time.monotonic()
+            while calls and now - calls[0] >= window:
+                calls.popleft()
+            if len(calls) < max_requests:
+                calls.append(now)
+                return
+            delay = window - (now - calls[0])
+            logger.info(f"Rate limit for {host} reached, waiting {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+# tweepy (Client, API) pairs keyed by a hash of the credentials, so re-created
+# XPosters reuse the same clients and their warm connection pool
+_X_CLIENT_CACHE: Dict[str, tuple] = {}
+_X_CLIENT_LOCK = threading.Lock()
 
 class XPoster:
     """Handles posting to X (formerly Twitter) using Tweepy"""
     
     def __init__(self, api_key: str, api_secret: str, access_token: str, access_token_secret: str):
         """Initialize X API client"""
-        if not TWEEPY_AVAILABLE:
-            raise ImportError("tweepy not installed. Run: pip install tweepy")
         try:
-            # Twitter API v2 client
-            self.client = tweepy.Client(
-                consumer_key=api_key,
-                consumer_secret=api_secret,
-                access_token=access_token,
-                access_token_secret=access_token_secret,
-                wait_on_rate_limit=True
-            )
-            
-            # Twitter API v1.1 for media upload
-            auth = tweepy.OAuth1UserHandler(api_key, api_secret, access_token, access_token_secret)
-            self.api_v1 = tweepy.API(auth)
-            
-            logger.info("X (Twitter) client initialized successfully")
+            import tweepy
+        except ImportError:
+            raise ImportError("tweepy not installed. Run: pip install tweepy") from None
+        self._tweepy = tweepy
+        try:
+            key = hashlib.sha256(
+                "\0".join((api_key, api_secret, access_token, access_token_secret)).encode()
+            ).hexdigest()
+            with _X_CLIENT_LOCK:
+                cached = _X_CLIENT_CACHE.get(key)
+                if cached is None:
+                    cached = self._build_clients(tweepy, api_key, api_secret, access_token, access_token_secret)
+                    _X_CLIENT_CACHE[key] = cached
+                    logger.info("X (Twitter) client initialized successfully")
+                else:
+                    logger.info("X (Twitter) client reused from cache")
+            self.client, self.api_v1 = cached
+            # v2 AsyncClient for the *_async methods, bound to the caller's aiohttp session
+            self._async_client = None
         except Exception as e:
             logger.error(f"Failed to initialize X client: {e}")
             raise
     
+    @staticmethod
+    def _build_clients(tweepy, api_key: str, api_secret: str, access_token: str, access_token_secret: str) -> tuple:
+        """Create the v2 Client and v1.1 API, sharing one pooled keep-alive session"""
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        
+        # Twitter API v2 client
+        client = tweepy.Client(
+            consumer_key=api_key,
+            consumer_secret=api_secret,
+            access_token=access_token,
+            access_token_secret=access_token_secret,
+            wait_on_rate_limit=True
+        )
+        client.session = session
+        
+        # Twitter API v1.1 for media upload
+        auth = tweepy.OAuth1UserHandler(api_key, api_secret, access_token, access_token_secret)
+        api_v1 = tweepy.API(auth)
+        api_v1.session = session
+        return client, api_v1
+    
+    @staticmethod
+    def _fit_tweet(text: str, limit: int = 280) -> str:
+        """Trim text to X's character limit, ending with a single-character ellipsis"""
+        return text if len(text) <= limit else text[:limit - 1] + "…"
+    
     def post_text(self, text: str) -> Optional[Dict[str, Any]]:
         """Post text to X"""
         try:
-            # X has a 280 character limit
-            if len(text) > 280:
-                text = text[:277] + "..."
-            
-            response = self.client.create_tweet(text=text)
+            response = self.client.create_tweet(text=self._fit_tweet(text))
             logger.info(f"Successfully posted to X: {response.data['id']}")
             return {"platform": "X", "id": response.data['id'], "success": True}
         except Exception as e:
             logger.error(f"Failed to post to X: {e}")
             return {"platform": "X", "success": False, "error": str(e)}
     
-    def post_with_image(self, text: str, image_path: str) -> Optional[Dict[str, Any]]:
-        """Post text with image to X"""
+    def post_with_image(self, text: str, image_path: str,
+                        image_data: Optional[bytes] = None) -> Optional[Dict[str, Any]]:
+        """Post text with image to X
+        
+        Args:
+            text: Tweet text
+            image_path: Path to image file (only used as the upload filename when image_data is given)
+            image_data: Encoded image bytes to upload directly, skipping the disk read
+        """
         try:
             # Upload media first
-            media = self.api_v1.media_upload(image_path)
+            if image_data is not None:
+                media = self.api_v1.media_upload(filename=os.path.basename(image_path), file=BytesIO(image_data))
+            else:
+                media = self.api_v1.media_upload(image_path)
             
             # Post tweet with media
-            if len(text) > 280:
-                text = text[:277] + "..."
+            response = self.client.create_tweet(text=self._fit_tweet(text), media_ids=[media.media_id])
+            logger.info(f"Successfully posted to X with image: {response.data['id']}")
+            return {"platform": "X", "id": response.data['id'], "success": True}
+        except Exception as e:
+            logger.error(f"Failed to post to X with image: {e}")
+            return {"platform": "X", "success": False, "error": str(e)}
+    
+    @staticmethod
+    def _split_thread(text: str, limit: int = 270) -> List[str]:
+        """Split text on word boundaries into numbered segments of at most limit characters"""
+        words = text.split()
+        if not words:
+            return []
+        # Text that fits in a single tweet is posted as-is, without a " (1/1)" suffix
+        if len(text) <= 280:
+            return [text]
+        count = 2
+        while True:
+            # Room left for the words once the " (i/N)" suffix is appended
+            budget = limit - len(f" ({count}/{count})")
+            segments = []
+            current = ""
+            for word in words:
+                while len(word) > budget:
+                    if current:
+                        segments.append(current)
+                        current = ""
+                    segments.append(word[:budget])
+                    word = word[budget:]
+                if not current:
+                    current = word
+                elif len(current) + 1 + len(word) <= budget:
+                    current = f"{current} {word}"
+                else:
+                    segments.append(current)
+                    current = word
+            if current:
+                segments.append(current)
+            # Re-split if the numbering needs more digits than were reserved
+            if len(str(len(segments))) <= len(str(count)):
+                break
+            count = len(segments)
+        if len(segments) == 1:
+            # Only whitespace pushed the text over the limit
+            return segments
+        total = len(segments)
+        return [f"{segment} ({i}/{total})" for i, segment in enumerate(segments, 1)]
+    
+    def post_thread(self, text: str) -> List[Dict[str, Any]]:
+        """Post long text as a thread of replies instead of truncating it
+        
+        Every tweet goes through the same client and its keep-alive session; the
+        chain stops at the first failure.
+        
+        Returns:
+            One result dict per tweet attempted, in thread order
+        """
+        results = []
+        previous_id = None
+        for segment in self._split_thread(text):
+            try:
+                response = self.client.create_tweet(text=segment, in_reply_to_tweet_id=previous_id)
+                previous_id = response.data['id']
+                results.append({"platform": "X", "id": previous_id, "success": True})
+            except Exception as e:
+                logger.error(f"Failed to post X thread segment {len(results) + 1}: {e}")
+                results.append({"platform": "X", "success": False, "error": str(e)})
+                break
+        logger.info(f"Posted X thread: {sum(r['success'] for r in results)} tweet(s)")
+        return results
+    
+    def _get_async_client(self, session):
+        """Return a tweepy AsyncClient sending its v2 requests on the given aiohttp session
+        
+        None when there is no session or tweepy's async extras (async-lru) are not
+        installed; callers then use the sync client in a worker thread.
+        """
+        if session is None:
+            return None
+        if self._async_client is None or self._async_client.session is not session:
+            try:
+                from tweepy.asynchronous import AsyncClient
+            except ImportError:
+                return None
+            
+            client = self.client
+            self._async_client = AsyncClient(
+                consumer_key=client.consumer_key,
+                consumer_secret=client.consumer_secret,
+                access_token=client.access_token,
+                access_token_secret=client.access_token_secret,
+                wait_on_rate_limit=True
+            )
+            self._async_client.session = session
+        return self._async_client
+    
+    async def post_text_async(self, text: str, session=None) -> Optional[Dict[str, Any]]:
+        """Async variant of post_text
+        
+        Args:
+            text: Tweet text
+            session: aiohttp.ClientSession for tweepy's AsyncClient; without one (or
+                without tweepy[async]) the sync post_text runs in a worker thread
+        """
+        async_client = self._get_async_client(session)
+        if async_client is None:
+            return await asyncio.to_thread(self.post_text, text)
+        try:
+            response = await async_client.create_tweet(text=self._fit_tweet(text))
+            logger.info(f"Successfully posted to X: {response.data['id']}")
+            return {"platform": "X", "id": response.data['id'], "success": True}
+        except Exception as e:
+            logger.error(f"Failed to post to X: {e}")
+            return {"platform": "X", "success": False, "error": str(e)}
+    
+    async def post_with_image_async(self, text: str, image_path: str,
+                                    image_data: Optional[bytes] = None,
+                                    session=None) -> Optional[Dict[str, Any]]:
+        """Async variant of post_with_image
+        
+        Media upload is v1.1-only and sync, so it runs in a worker thread; with a
+        session the tweet itself is then created on the event loop.
+        """
+        async_client = self._get_async_client(session)
+        if async_client is None:
+            return await asyncio.to_thread(self.post_with_image, text, image_path, image_data)
+        try:
+            if image_data is not None:
+                media = await asyncio.to_thread(
+                    self.api_v1.media_upload, filename=os.path.basename(image_path), file=BytesIO(image_data))
+            else:
+                media = await asyncio.to_thread(self.api_v1.media_upload, image_path)
             
-            response = self.client.create_tweet(text=text, media_ids=[media.media_id])
+            response = await async_client.create_tweet(
+                text=self._fit_tweet(text), media_ids=[media.media_id])
             logger.info(f"Successfully posted to X with image: {response.data['id']}")
             return {"platform": "X", "id": response.data['id'], "success": True}
         except Exception as e:
@@ -132,19 +371,118 @@ class XPoster:
 class FacebookPoster:
     """Handles posting to Facebook Pages using Graph API"""
     
-    def __init__(self, page_access_token: str, page_id: str):
+    # Long-lived page tokens derived from a user token, keyed by a hash of the
+    # user token and page ID; holds live credentials, so it is written owner-only
+    TOKEN_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "pizzini", "fb_token.json")
+    
+    def __init__(self, page_access_token: str, page_id: str,
+                 app_id: Optional[str] = None, app_secret: Optional[str] = None,
+                 user_access_token: Optional[str] = None):
         """Initialize Facebook Page poster
         
         Args:
             page_access_token: Long-lived page access token
             page_id: Facebook Page ID
+            app_id: Facebook App ID (with app_secret and user_access_token, see below)
+            app_secret: Facebook App secret
+            user_access_token: User token of a page admin; when given with the app
+                credentials it is exchanged for a long-lived user token and the page's
+                own token is read from it, cached across runs. page_access_token is
+                used if that fails.
         """
         self.access_token = page_access_token
         self.page_id = page_id
         self.api_version = "v18.0"
         self.base_url = f"https://graph.facebook.com/{self.api_version}"
+        # Persistent session: keep-alive connections to graph.facebook.com skip the
+        # TCP+TLS handshake on every post after the first
+        self.session = make_session(pool_size=8)
+        if user_access_token and app_id and app_secret:
+            self.access_token = (
+                self._long_lived_page_token(user_access_token, app_id, app_secret)
+                or page_access_token
+            )
         logger.info("Facebook Page poster initialized")
     
+    def _long_lived_page_token(self, user_token: str, app_id: str, app_secret: str) -> Optional[str]:
+        """Return a long-lived page token obtained through user_token, or None on failure
+        
+        The user token is exchanged for a long-lived one (fb_exchange_token) and the
+        page token is then read with /{page_id}?fields=access_token. A cached page
+        token is reused while its user token has more than an hour left (or never
+        expires).
+        """
+        key = hashlib.sha256(f"{user_token}\0{self.page_id}".encode('utf-8')).hexdigest()
+        try:
+            with open(self.TOKEN_CACHE_PATH, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        if not isinstance(cache, dict):
+            cache = {}
+        
+        # A truncated or hand-edited entry is treated as a miss and replaced below
+        cached = cache.get(key)
+        now = time.time()
+        try:
+            token, expires_at = cached['token'], float(cached['expires_at'])
+        except (TypeError, KeyError, ValueError):
+            token = None
+        if isinstance(token, str) and token and (expires_at == 0 or expires_at - now > 3600):
+            logger.info("Using cached long-lived Facebook page token")
+            return token
+        
+        try:
+            response = self.session.get(f"{self.base_url}/oauth/access_token", params={
+                'grant_type': 'fb_exchange_token',
+                'client_id': app_id,
+                'client_secret': app_secret,
+                'fb_exchange_token': user_token
+            })
+            response.raise_for_status()
+            exchanged = response.json()
+            
+            response = self.session.get(f"{self.base_url}/{self.page_id}", params={
+                'fields': 'access_token',
+                'access_token': exchanged['access_token']
+            })
+            response.raise_for_status()
+            page_token = response.json()['access_token']
+        except Exception as e:
+            logger.warning(f"Could not obtain a long-lived Facebook page token: {e}")
+            return None
+        
+        expires_in = exchanged.get('expires_in')
+        cache[key] = {
+            'token': page_token,
+            'expires_at': int(now + expires_in) if expires_in else 0
+        }
+        try:
+            os.makedirs(os.path.dirname(self.TOKEN_CACHE_PATH), mode=0o700, exist_ok=True)
+            tmp_path = self.TOKEN_CACHE_PATH + ".tmp"
+            # Created owner read/write only (a stale .tmp is removed first, since
+            # O_CREAT's mode does not apply to an existing file)
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, self.TOKEN_CACHE_PATH)
+        except OSError as e:
+            logger.warning(f"Could not cache Facebook token: {e}")
+        logger.info("Obtained a long-lived Facebook page token")
+        return page_token
+    
+    def close(self):
+        """Release the pooled HTTP connections"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
     def post_text(self, text: str, link: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Post text to Facebook Page
         
@@ -162,7 +500,7 @@ class FacebookPoster:
             if link:
                 params['link'] = link
             
-            response = requests.post(endpoint, data=params)
+            response = self.session.post(endpoint, data=params)
             response.raise_for_status()
             
             result = response.json()
@@ -172,25 +510,104 @@ class FacebookPoster:
             logger.error(f"Failed to post to Facebook: {e}")
             return {"platform": "Facebook", "success": False, "error": str(e)}
     
-    def post_photo(self, image_path: str, caption: str) -> Optional[Dict[str, Any]]:
+    def post_batch(self, messages: List[str]) -> List[Dict[str, Any]]:
+        """Post several text messages with Graph API batch requests
+        
+        Up to 50 posts travel in one HTTP round-trip instead of one request each.
+        
+        Args:
+            messages: Post contents, published in order
+            
+        Returns:
+            One result dict per message, in the same order
+        """
+        results = []
+        for start in range(0, len(messages), 50):
+            chunk = messages[start:start + 50]
+            batch = [
+                {
+                    "method": "POST",
+                    "relative_url": f"{self.page_id}/feed",
+                    "body": urlencode({'message': message}),
+                }
+                for message in chunk
+            ]
+            try:
+                response = self.session.post(
+                    f"{self.base_url}/",
+                    data={'batch': json.dumps(batch), 'access_token': self.access_token}
+                )
+                response.raise_for_status()
+                replies = response.json()
+            except Exception as e:
+                logger.error(f"Failed to post Facebook batch: {e}")
+                results.extend({"platform": "Facebook", "success": False, "error": str(e)} for _ in chunk)
+                continue
+            
+            # Replies are matched to messages by position; a null or missing reply means
+            # Facebook did not run that sub-request (e.g. timeout)
+            if not isinstance(replies, list):
+                replies = []
+            for i in range(len(chunk)):
+                reply = replies[i] if i < len(replies) else None
+                if not isinstance(reply, dict):
+                    logger.error("Failed to post to Facebook in batch: sub-request not processed")
+                    results.append({"platform": "Facebook", "success": False,
+                                    "error": "sub-request not processed"})
+                elif reply.get('code') == 200:
+                    try:
+                        post_id = json.loads(reply['body']).get('id')
+                    except (KeyError, ValueError, AttributeError) as e:
+                        # One malformed sub-response must not lose the results of the rest
+                        logger.error(f"Unreadable Facebook batch reply: {e}")
+                        results.append({"platform": "Facebook", "success": False, "error": str(e)})
+                        continue
+                    logger.info(f"Successfully posted to Facebook: {post_id}")
+                    results.append({"platform": "Facebook", "id": post_id, "success": True})
+                else:
+                    error = reply.get('body')
+                    logger.error(f"Failed to post to Facebook in batch: {error}")
+                    results.append({"platform": "Facebook", "success": False, "error": str(error)})
+        return results
+    
+    def post_photo(self, image_path: str, caption: str,
+                   image_data: Optional[bytes] = None) -> Optional[Dict[str, Any]]:
         """Post photo to Facebook Page
         
         Args:
-            image_path: Path to image file
+            image_path: Path to image file (only used as the upload filename when image_data is given)
             caption: Photo caption
+            image_data: Encoded image bytes to upload directly, skipping the disk read
         """
         try:
             endpoint = f"{self.base_url}/{self.page_id}/photos"
+            params = {
+                'message': caption,
+                'access_token': self.access_token
+            }
             
-            with open(image_path, 'rb') as image_file:
-                files = {'source': image_file}
-                params = {
-                    'message': caption,
-                    'access_token': self.access_token
-                }
-                
-                response = requests.post(endpoint, data=params, files=files)
+            if image_data is not None:
+                files = {'source': (os.path.basename(image_path), image_data)}
+                response = self.session.post(endpoint, data=params, files=files)
                 response.raise_for_status()
+            else:
+                with open(image_path, 'rb') as image_file:
+                    try:
+                        from requests_toolbelt.multipart.encoder import MultipartEncoder
+                    except ImportError:
+                        # requests builds the whole multipart body in memory
+                        files = {'source': image_file}
+                        response = self.session.post(endpoint, data=params, files=files)
+                    else:
+                        # Stream the file into the socket in chunks instead of buffering it
+                        content_type = mimetypes.guess_type(image_path)[0] or 'application/octet-stream'
+                        encoder = MultipartEncoder(fields={
+                            **params,
+                            'source': (os.path.basename(image_path), image_file, content_type),
+                        })
+                        response = self.session.post(endpoint, data=encoder,
+                                                     headers={'Content-Type': encoder.content_type})
+                    response.raise_for_status()
             
             result = response.json()
             logger.info(f"Successfully posted photo to Facebook: {result.get('id')}")
@@ -198,38 +615,154 @@ class FacebookPoster:
         except Exception as e:
             logger.error(f"Failed to post photo to Facebook: {e}")
             return {"platform": "Facebook", "success": False, "error": str(e)}
+    
+    async def post_text_async(self, text: str, link: Optional[str] = None,
+                              session=None) -> Optional[Dict[str, Any]]:
+        """Async variant of post_text
+        
+        Args:
+            text: Post content
+            link: Optional URL to include
+            session: aiohttp.ClientSession to send the request on; without one the
+                sync post_text runs in a worker thread
+        """
+        if session is None:
+            return await asyncio.to_thread(self.post_text, text, link)
+        try:
+            endpoint = f"{self.base_url}/{self.page_id}/feed"
+            params = {
+                'message': text,
+                'access_token': self.access_token
+            }
+            
+            if link:
+                params['link'] = link
+            
+            async with session.post(endpoint, data=params) as response:
+                response.raise_for_status()
+                result = await response.json()
+            logger.info(f"Successfully posted to Facebook: {result.get('id')}")
+            return {"platform": "Facebook", "id": result.get('id'), "success": True}
+        except Exception as e:
+            logger.error(f"Failed to post to Facebook: {e}")
+            return {"platform": "Facebook", "success": False, "error": str(e)}
+    
+    async def post_photo_async(self, image_path: str, caption: str,
+                               image_data: Optional[bytes] = None,
+                               session=None) -> Optional[Dict[str, Any]]:
+        """Async variant of post_photo
+        
+        Args:
+            image_path: Path to image file (only used as the upload filename when image_data is given)
+            caption: Photo caption
+            image_data: Encoded image bytes to upload directly, skipping the disk read
+            session: aiohttp.ClientSession to send the request on; without one the
+                sync post_photo runs in a worker thread
+        """
+        if session is None:
+            return await asyncio.to_thread(self.post_photo, image_path, caption, image_data)
+        try:
+            import aiohttp
+            
+            endpoint = f"{self.base_url}/{self.page_id}/photos"
+            if image_data is None:
+                with open(image_path, 'rb') as image_file:
+                    image_data = image_file.read()
+            
+            form = aiohttp.FormData()
+            form.add_field('message', caption)
+            form.add_field('access_token', self.access_token)
+            form.add_field('source', image_data, filename=os.path.basename(image_path))
+            
+            async with session.post(endpoint, data=form) as response:
+                response.raise_for_status()
+                result = await response.json()
+            logger.info(f"Successfully posted photo to Facebook: {result.get('id')}")
+            return {"platform": "Facebook", "id": result.get('id'), "success": True}
+        except Exception as e:
+            logger.error(f"Failed to post photo to Facebook: {e}")
+            return {"platform": "Facebook", "success": False, "error": str(e)}
 
 class InstagramPoster:
     """Handles posting to Instagram using instagrapi"""
     
     def __init__(self, username: str, password: str, session_file: str = "instagram_session.json"):
         """Initialize Instagram client with session persistence"""
-        if not INSTAGRAPI_AVAILABLE:
-            raise ImportError("instagrapi not installed. Run: pip install instagrapi")
         try:
-            self.client = instagrapi.Client()
+            import instagrapi
+            from instagrapi.exceptions import LoginRequired
+        except ImportError:
+            raise ImportError("instagrapi not installed. Run: pip install instagrapi") from None
+        self._instagrapi = instagrapi
+        # Hash of the settings last written to session_file, to skip identical rewrites
+        self._settings_hash = None
+        try:
+            self.client = self._new_client()
             self.session_file = session_file
             
             # Try to load existing session
             if os.path.exists(session_file):
                 try:
                     self.client.load_settings(session_file)
-                    self.client.login(username, password)
-                    logger.info("Instagram client initialized with saved session")
+                    self._settings_hash = hashlib.sha256(self._serialize_settings()).hexdigest()
+                    # A cheap authenticated probe: when the saved cookies are still good
+                    # the login round-trip (and its challenge risk) is skipped entirely
+                    try:
+                        self.client.get_timeline_feed()
+                        logger.info("Instagram client initialized with saved session")
+                    except LoginRequired:
+                        self.client.login(username, password)
+                        self._save_settings()
+                        logger.info("Instagram session expired, logged in again and saved")
                 except Exception as e:
                     logger.warning(f"Failed to load session, creating new: {e}")
-                    self.client = instagrapi.Client()
+                    self.client = self._new_client()
                     self.client.login(username, password)
-                    self.client.dump_settings(session_file)
+                    self._save_settings()
             else:
                 # First time login
                 self.client.login(username, password)
-                self.client.dump_settings(session_file)
+                self._save_settings()
                 logger.info("Instagram client initialized and session saved")
         except Exception as e:
             logger.error(f"Failed to initialize Instagram client: {e}")
             raise
     
+    def _serialize_settings(self) -> bytes:
+        """Encode the client's session settings the way they are stored on disk"""
+        settings = self.client.get_settings()
+        try:
+            import orjson
+        except ImportError:
+            return json.dumps(settings, indent=4).encode('utf-8')
+        return orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+    
+    def _save_settings(self):
+        """Write the session settings to session_file, only when they changed
+        
+        The file is written beside the target and renamed over it, so an interrupted
+        write never leaves a half-written session that would force a fresh login.
+        """
+        data = self._serialize_settings()
+        digest = hashlib.sha256(data).hexdigest()
+        if digest == self._settings_hash:
+            return
+        tmp_path = self.session_file + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, self.session_file)
+        self._settings_hash = digest
+    
+    def _new_client(self):
+        """Create an instagrapi client whose HTTP sessions keep a larger keep-alive pool"""
+        client = self._instagrapi.Client()
+        # instagrapi configures headers on its own sessions, so mount a pooled adapter
+        # on them rather than swapping in a foreign Session
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        client.private.mount("https://", adapter)
+        client.public.mount("https://", adapter)
+        return client
+    
     def post_image_with_caption(self, image_path: str, caption: str) -> Optional[Dict[str, Any]]:
         """Post image with caption to Instagram"""
         try:
@@ -241,6 +774,10 @@ class InstagramPoster:
             logger.error(f"Failed to post to Instagram: {e}")
             return {"platform": "Instagram", "success": False, "error": str(e)}
     
+    async def post_image_with_caption_async(self, image_path: str, caption: str) -> Optional[Dict[str, Any]]:
+        """Async variant of post_image_with_caption (instagrapi is sync-only, so it runs in a worker thread)"""
+        return await asyncio.to_thread(self.post_image_with_caption, image_path, caption)
+    
     def post_story(self, image_path: str) -> Optional[Dict[str, Any]]:
         """Post to Instagram story"""
         try:
@@ -331,6 +868,31 @@ class AudioGenerator:
         },
     }
     
+    # SSML skeletons for Azure synthesis, filled with str.format_map per file
+    _AZURE_SSML_WITH_TITLE = (
+        "<speak version='1.0' "
+        "xmlns='http://www.w3.org/2001/10/synthesis' xml:lang='it-IT'>"
+        "<voice name='{voice_name}'>"
+        "<emphasis level='moderate'><prosody rate='{rate}' pitch='+2%'>{title}.</prosody></emphasis>"
+        "<break time='1500ms'/>"
+        "<prosody rate='{rate}' pitch='{pitch}'>{body}</prosody>"
+        "</voice></speak>"
+    )
+    _AZURE_SSML_PLAIN = (
+        "<speak version='1.0' "
+        "xmlns='http://www.w3.org/2001/10/synthesis' xml:lang='it-IT'>"
+        "<voice name='{voice_name}'>"
+        "<prosody rate='{rate}' pitch='{pitch}'>{body}</prosody>"
+        "</voice></speak>"
+    )
+    
+    # Synthesized episodes kept in <output_dir>/cache for reuse (least recently used go first)
+    AUDIO_CACHE_MAX_ENTRIES = 100
+    
+    # Loaded Coqui models shared by all AudioGenerator instances, keyed by model name
+    _coqui_cache: Dict[str, Any] = {}
+    _coqui_lock = threading.Lock()
+    
     def __init__(self, voice: str = 'priest-old-1', output_dir: str = "audio_output", 
                  azure_key: str = None, azure_region: str = None,
                  azure_pitch: str = '-8%', azure_rate: str = '0.90'):
@@ -351,6 +913,9 @@ class AudioGenerator:
         self.azure_pitch = azure_pitch
         self.azure_rate = azure_rate
         self.coqui_model = None
+        self._speech_config = None
+        # Output path -> content-addressed cache file it was copied from
+        self._audio_cache_paths: Dict[str, str] = {}
         
         # Determine which TTS service to use
         if voice.startswith('cloudtts-'):
@@ -367,15 +932,16 @@ class AudioGenerator:
                 raise ValueError("Azure key and region required for Azure voices")
             self.tts_service = 'azure'
             voice_desc = self.AZURE_VOICE_OPTIONS.get(voice, {}).get('description', voice)
+            # One SpeechConfig per generator; each episode only needs its own synthesizer
+            import azure.cognitiveservices.speech as speechsdk
+            self._speech_config = speechsdk.SpeechConfig(subscription=azure_key, region=azure_region)
         elif voice in self.COQUI_VOICE_OPTIONS:
-            if not COQUI_TTS_AVAILABLE:
+            if not _coqui_tts_importable():
                 raise ImportError("Coqui TTS not available. Install: pip install TTS")
             self.tts_service = 'coqui'
             voice_config = self.COQUI_VOICE_OPTIONS[voice]
             voice_desc = voice_config['description']
-            # Initialize Coqui model (lazy loading)
-            logger.info(f"Loading Coqui TTS model: {voice_config['model']}...")
-            self.coqui_model = CoquiTTS(voice_config['model'])
+            self.coqui_model = self._get_coqui(voice_config['model'])
         elif voice.startswith('gtts-'):
             if not GTTS_AVAILABLE:
                 raise ImportError("gTTS not available. Install: pip install gTTS")
@@ -383,13 +949,12 @@ class AudioGenerator:
             voice_desc = self.GTTS_VOICE_OPTIONS.get(voice, self.GTTS_VOICE_OPTIONS['gtts-it-male-slow'])['description']
         else:
             # Default to Coqui if available, fall back to gTTS
-            if COQUI_TTS_AVAILABLE:
+            if _coqui_tts_importable():
                 self.voice = 'priest-old-1'
                 self.tts_service = 'coqui'
                 voice_config = self.COQUI_VOICE_OPTIONS['priest-old-1']
                 voice_desc = voice_config['description']
-                logger.info(f"Loading Coqui TTS model: {voice_config['model']}...")
-                self.coqui_model = CoquiTTS(voice_config['model'])
+                self.coqui_model = self._get_coqui(voice_config['model'])
             else:
                 self.voice = 'gtts-it-male-slow'
                 self.tts_service = 'gtts'
@@ -400,6 +965,28 @@ class AudioGenerator:
         
         logger.info(f"Audio generator initialized with: {voice_desc}")
     
+    @classmethod
+    def _get_coqui(cls, model_name: str):
+        """Return the shared Coqui model for model_name, loading it on first use
+        
+        Models are hundreds of MB of weights, so each one is loaded (and moved to
+        the GPU when available) once per process rather than once per instance.
+        """
+        with cls._coqui_lock:
+            model = cls._coqui_cache.get(model_name)
+            if model is None:
+                logger.info(f"Loading Coqui TTS model: {model_name}...")
+                from TTS.api import TTS as CoquiTTS
+                model = CoquiTTS(model_name)
+                try:
+                    import torch
+                    if torch.cuda.is_available():
+                        model = model.to('cuda')
+                except ImportError:
+                    pass
+                cls._coqui_cache[model_name] = model
+            return model
+    
     def text_to_speech(self, text: str, title: str = "audio", add_intro: bool = False) -> str:
         """Convert text to speech and save as MP3
         
@@ -426,13 +1013,14 @@ class AudioGenerator:
             
             # Generate speech based on service
             if self.tts_service == 'azure':
-                self._generate_azure_speech(full_text, filepath)
+                generate = self._generate_azure_speech
             elif self.tts_service == 'cloudtts':
-                self._generate_cloud_tts_speech(full_text, filepath)
+                generate = self._generate_cloud_tts_speech
             elif self.tts_service == 'coqui':
-                self._generate_coqui_speech(full_text, filepath)
+                generate = self._generate_coqui_speech
             else:
-                self._generate_gtts_speech(full_text, filepath)
+                generate = self._generate_gtts_speech
+            filepath = self._synthesize_cached(full_text, filepath, lambda path: generate(full_text, path))
             
             logger.info(f"Generated audio file: {filepath}")
             return filepath
@@ -495,6 +1083,8 @@ class AudioGenerator:
         GOOGLE_APPLICATION_CREDENTIALS to your service account key path, or run
         on GCP where the default service account has Cloud TTS access).
         """
+        from google.cloud import texttospeech as gcloud_tts
+        
         voice_cfg = self.CLOUD_TTS_VOICE_OPTIONS[self.voice]
         client = gcloud_tts.TextToSpeechClient()
 
@@ -528,34 +1118,42 @@ class AudioGenerator:
         """Generate speech using Coqui TTS (free, high quality)"""
         voice_config = self.COQUI_VOICE_OPTIONS[self.voice]
         
-        # Generate speech with Coqui
-        wav_filepath = filepath.replace('.mp3', '.wav')
-        self.coqui_model.tts_to_file(
-            text=text,
-            file_path=wav_filepath,
-            speed=voice_config.get('speed', 1.0)
-        )
+        # Generate speech with Coqui. tts_to_file already splits the text into
+        # sentences and concatenates their waveforms; on a GPU the forward passes run
+        # under FP16 autocast (weights stay FP32, so layers unsafe in half precision
+        # keep full precision)
+        import torch
         
-        # Convert WAV to MP3 if pydub is available
-        if PYDUB_AVAILABLE:
-            try:
-                from pydub import AudioSegment
-                audio = AudioSegment.from_wav(wav_filepath)
-                audio.export(filepath, format='mp3', bitrate='128k')
-                os.remove(wav_filepath)  # Clean up WAV file
-            except Exception as e:
-                logger.warning(f"Could not convert to MP3: {e}. Keeping WAV file.")
-                # Rename WAV to MP3 path for consistency
-                if os.path.exists(wav_filepath):
-                    os.rename(wav_filepath, filepath.replace('.mp3', '.wav'))
+        if torch.cuda.is_available():
+            precision = torch.autocast('cuda', dtype=torch.float16)
         else:
-            # Keep WAV format if pydub not available
-            logger.info(f"pydub not available - audio saved as WAV format")
+            precision = contextlib.nullcontext()
+        wav_filepath = filepath.replace('.mp3', '.wav')
+        with precision, torch.inference_mode():
+            self.coqui_model.tts_to_file(
+                text=text,
+                file_path=wav_filepath,
+                speed=voice_config.get('speed', 1.0),
+                split_sentences=True
+            )
+        
+        # Convert WAV to MP3 with ffmpeg directly: the PCM stays in ffmpeg's buffers
+        # instead of being materialized in Python
+        try:
+            subprocess.run(
+                ['ffmpeg', '-y', '-loglevel', 'error', '-i', wav_filepath, '-b:a', '128k', filepath],
+                check=True
+            )
+            os.remove(wav_filepath)  # Clean up WAV file
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.warning(f"Could not convert to MP3: {e}. Keeping WAV file.")
     
     def _generate_gtts_speech(self, text: str, filepath: str):
         """Generate speech using Google TTS"""
         voice_config = self.GTTS_VOICE_OPTIONS.get(self.voice, self.GTTS_VOICE_OPTIONS['gtts-it-male-slow'])
         
+        from gtts import gTTS
+        
         tts = gTTS(
             text=text,
             lang=voice_config['lang'],
@@ -573,11 +1171,18 @@ class AudioGenerator:
         followed by a 1.5 s pause before the body text.
         """
         import html as html_lib
-        speech_config = speechsdk.SpeechConfig(subscription=self.azure_key, region=self.azure_region)
+        import azure.cognitiveservices.speech as speechsdk
+        if self._speech_config is None:
+            self._speech_config = speechsdk.SpeechConfig(subscription=self.azure_key, region=self.azure_region)
+        speech_config = self._speech_config
 
         # Get voice name from configuration
         voice_config = self.AZURE_VOICE_OPTIONS[self.voice]
-        voice_name = voice_config['voice']
+        fields = {
+            'voice_name': voice_config['voice'],
+            'rate': self.azure_rate,
+            'pitch': self.azure_pitch,
+        }
 
         def _title_case_for_tts(s: str) -> str:
             """Convert ALL-CAPS words to Title Case so TTS reads them as words,
@@ -587,28 +1192,13 @@ class AudioGenerator:
             return ' '.join(fix_word(w) for w in s.split())
 
         if announcement_title:
-            title_ssml = html_lib.escape(_title_case_for_tts(announcement_title))
-            body_ssml  = html_lib.escape(text)
-            ssml_text = (
-                f"<speak version='1.0' "
-                f"xmlns='http://www.w3.org/2001/10/synthesis' xml:lang='it-IT'>"
-                f"<voice name='{voice_name}'>"
-                f"<emphasis level='moderate'><prosody rate='{self.azure_rate}' pitch='+2%'>{title_ssml}.</prosody></emphasis>"
-                f"<break time='1500ms'/>"
-                f"<prosody rate='{self.azure_rate}' pitch='{self.azure_pitch}'>{body_ssml}</prosody>"
-                f"</voice></speak>"
-            )
+            fields['title'] = html_lib.escape(_title_case_for_tts(announcement_title))
+            fields['body'] = html_lib.escape(text)
+            ssml_text = self._AZURE_SSML_WITH_TITLE.format_map(fields)
         else:
             # Plain content path — no title announcement
-            ssml_text = f"""
-        <speak version='1.0' xmlns='http://www.w3.org/2001/10/synthesis' xml:lang='it-IT'>
-            <voice name='{voice_name}'>
-                <prosody rate='{self.azure_rate}' pitch='{self.azure_pitch}'>
-                    {text}
-                </prosody>
-            </voice>
-        </speak>
-        """
+            fields['body'] = text
+            ssml_text = self._AZURE_SSML_PLAIN.format_map(fields)
         
         # Configure output to file
         audio_config = speechsdk.audio.AudioOutputConfig(filename=filepath)
@@ -644,9 +1234,12 @@ class AudioGenerator:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f"{safe_title}_cloudtts_{timestamp}.mp3"
                 audio_path = os.path.join(self.output_dir, filename)
-                self._generate_cloud_tts_speech(
-                    normalized_content, audio_path,
-                    announcement_title=normalized_title,
+                audio_path = self._synthesize_cached(
+                    f"{normalized_title}\x00{normalized_content}", audio_path,
+                    lambda path: self._generate_cloud_tts_speech(
+                        normalized_content, path,
+                        announcement_title=normalized_title,
+                    ),
                 )
             elif self.tts_service == 'azure':
                 # Azure TTS: SSML with title announcement + 1.5 s break + body
@@ -654,9 +1247,12 @@ class AudioGenerator:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f"{safe_title}_azure_{timestamp}.mp3"
                 audio_path = os.path.join(self.output_dir, filename)
-                self._generate_azure_speech(
-                    normalized_content, audio_path,
-                    announcement_title=normalized_title,
+                audio_path = self._synthesize_cached(
+                    f"{normalized_title}\x00{normalized_content}", audio_path,
+                    lambda path: self._generate_azure_speech(
+                        normalized_content, path,
+                        announcement_title=normalized_title,
+                    ),
                 )
             else:
                 # Other TTS services: pass normalized content (no title spoken in audio)
@@ -674,15 +1270,110 @@ class AudioGenerator:
             logger.error(f"Failed to create podcast episode: {e}")
             raise
     
+    def _synthesize_cached(self, spoken: str, filepath: str, generate) -> str:
+        """Produce filepath from the content-addressed audio cache, synthesizing on a miss
+        
+        The cache keeps the AUDIO_CACHE_MAX_ENTRIES most recently used entries;
+        older ones are deleted as new ones are added.
+        
+        Args:
+            spoken: Everything that is read aloud (the cache key, with voice and prosody)
+            filepath: Requested output path
+            generate: Callable writing the MP3 for spoken to the path it is given
+            
+        Returns:
+            Path of the audio written: filepath, or its .wav sibling when the engine
+            could only produce a WAV (Coqui without ffmpeg); that file is not cached
+        """
+        key = hashlib.sha256(
+            f"{self.voice}|{self.azure_pitch}|{self.azure_rate}|{spoken}".encode('utf-8')
+        ).hexdigest()
+        cache_dir = os.path.join(self.output_dir, "cache")
+        cache_path = os.path.join(cache_dir, f"{key}.mp3")
+        
+        if os.path.exists(cache_path):
+            logger.info(f"Reusing cached audio {key[:12]} (same voice and text)")
+            # Mark as recently used for pruning
+            os.utime(cache_path)
+        else:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Synthesize beside the cache entry and rename, so an interrupted run
+            # never leaves a truncated file under the final key
+            partial_path = os.path.join(cache_dir, f"{key}.partial.mp3")
+            generate(partial_path)
+            if not os.path.exists(partial_path):
+                partial_wav = os.path.splitext(partial_path)[0] + ".wav"
+                if not os.path.exists(partial_wav):
+                    raise FileNotFoundError(f"TTS engine produced no audio for {filepath}")
+                wav_path = os.path.splitext(filepath)[0] + ".wav"
+                os.replace(partial_wav, wav_path)
+                logger.warning(f"No MP3 produced; kept WAV at {wav_path} (not cached)")
+                return wav_path
+            os.replace(partial_path, cache_path)
+            self._prune_audio_cache(cache_dir)
+        
+        # Replace any existing output (names only go down to the second). Unlinking also
+        # matters for the copy below: writing through an old hard link would overwrite
+        # the cache entry it points at
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(filepath)
+        try:
+            os.link(cache_path, filepath)
+        except OSError:
+            # Different filesystem or no hard-link support
+            shutil.copyfile(cache_path, filepath)
+        self._audio_cache_paths[filepath] = cache_path
+        return filepath
+    
+    def _prune_audio_cache(self, cache_dir: str):
+        """Delete the least recently used cache entries (and their .meta) beyond the limit"""
+        entries = []
+        for entry in os.scandir(cache_dir):
+            if entry.name.endswith(".mp3") and not entry.name.endswith(".partial.mp3"):
+                entries.append((entry.stat().st_mtime, entry.path))
+        if len(entries) <= self.AUDIO_CACHE_MAX_ENTRIES:
+            return
+        entries.sort()
+        # Output files are hard links or copies, so they survive their cache entry
+        for _, path in entries[:len(entries) - self.AUDIO_CACHE_MAX_ENTRIES]:
+            for stale in (path, path[:-len(".mp3")] + ".meta"):
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(stale)
+    
     def _get_audio_duration(self, audio_path: str) -> float:
-        """Get duration of audio file in seconds"""
-        if not PYDUB_AVAILABLE:
-            logger.debug("pydub not available - cannot get audio duration")
+        """Get duration of audio file in seconds
+        
+        For files served from the audio cache the value is kept in a .meta sidecar
+        next to the cache entry, so repeat episodes skip the MP3 header parse.
+        """
+        cache_path = self._audio_cache_paths.get(audio_path)
+        meta_path = cache_path[:-len(".mp3")] + ".meta" if cache_path else None
+        if meta_path and os.path.exists(meta_path):
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    return float(json.load(f)['duration'])
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+        
+        duration = self._read_audio_duration(audio_path)
+        if meta_path and duration:
+            try:
+                with open(meta_path, 'w', encoding='utf-8') as f:
+                    json.dump({'duration': duration}, f)
+            except OSError as e:
+                logger.debug(f"Could not write audio duration sidecar: {e}")
+        return duration
+    
+    def _read_audio_duration(self, audio_path: str) -> float:
+        """Read the duration of an MP3 file from its header"""
+        if not MUTAGEN_AVAILABLE:
+            logger.debug("mutagen not available - cannot get audio duration")
             return 0.0
         
         try:
-            audio = AudioSegment.from_mp3(audio_path)
-            return len(audio) / 1000.0  # Convert milliseconds to seconds
+            from mutagen.mp3 import MP3
+            # Parses the MP3 header/Xing frame only instead of decoding the whole file
+            return MP3(audio_path).info.length
         except Exception as e:
             logger.warning(f"Could not get audio duration: {e}")
             return 0.0
@@ -693,7 +1384,7 @@ class AudioGenerator:
         voices = []
         
         # Add Coqui TTS voices (FREE, RECOMMENDED)
-        if COQUI_TTS_AVAILABLE:
+        if _coqui_tts_importable():
             for key, config in cls.COQUI_VOICE_OPTIONS.items():
                 voices.append({'key': key, 'service': '🆓 Coqui TTS (FREE - Recommended)', **config})
         
@@ -769,8 +1460,15 @@ class SpotifyPodcastPoster:
             }
             
             metadata_path = audio_path.replace('.mp3', '_upload_instructions.json')
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            try:
+                import orjson
+            except ImportError:
+                with open(metadata_path, 'w', encoding='utf-8') as f:
+                    json.dump(metadata, f, indent=2, ensure_ascii=False)
+            else:
+                # orjson encodes straight to UTF-8 bytes (non-ASCII kept, like ensure_ascii=False)
+                with open(metadata_path, 'wb') as f:
+                    f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
             
             logger.info(f"✅ Episode ready for upload!")
             logger.info(f"📄 Upload instructions saved: {metadata_path}")
@@ -796,6 +1494,51 @@ class SpotifyPodcastPoster:
                 "error": str(e)
             }
 
+@contextlib.contextmanager
+def _temp_image_file(image_data: bytes, suffix: str):
+    """Yield the path of a temp file (RAM-backed /dev/shm when available) holding image_data
+    
+    The file is closed before the path is handed out, since uploaders reopen it by
+    name (not possible for an open NamedTemporaryFile on Windows), and removed on exit.
+    """
+    fd, path = tempfile.mkstemp(suffix=suffix, dir="/dev/shm" if os.path.isdir("/dev/shm") else None)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(image_data)
+        yield path
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(path)
+
+# Encoded quote images shared by all ImageGenerator instances, most recently used last
+_QUOTE_IMAGE_CACHE: "OrderedDict[tuple, bytes]" = OrderedDict()
+_QUOTE_IMAGE_CACHE_SIZE = 128
+# Guards the OrderedDict above: posters render from worker threads
+_QUOTE_IMAGE_CACHE_LOCK = threading.Lock()
+
+@functools.lru_cache(maxsize=32)
+def _get_font(path: str, size: int):
+    """Load a TrueType font once per (path, size), falling back to PIL's default font"""
+    from PIL import ImageFont
+    
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        return ImageFont.load_default()
+
+@functools.lru_cache(maxsize=4096)
+def _word_advance(font_key: tuple, word: str) -> float:
+    """Advance width of a word in the (path, size) font; common words are shaped only once"""
+    return _get_font(*font_key).getlength(word)
+
+def _font_line_height(font) -> int:
+    """Line pitch (ascent + descent) of a font; bitmap fallback fonts only expose getbbox"""
+    if hasattr(font, "getmetrics"):
+        ascent, descent = font.getmetrics()
+        return ascent + descent
+    bbox = font.getbbox("Ag")
+    return bbox[3] - bbox[1]
+
 class ImageGenerator:
     """Generates images for social media posts"""
     
@@ -805,23 +1548,82 @@ class ImageGenerator:
         self.background_color = (255, 255, 255)  # White background
         self.text_color = (51, 51, 51)  # Dark gray text
         self.accent_color = (74, 144, 226)  # Blue accent
+        # Fonts are parsed once and shared by every rendered image; the (path, size)
+        # keys also index the per-word width cache used when wrapping
+        self.title_font_key = ("arial.ttf", 48)
+        self.content_font_key = ("arial.ttf", 32)
+        self.date_font_key = ("arial.ttf", 24)
+        self.title_font = _get_font(*self.title_font_key)
+        self.content_font = _get_font(*self.content_font_key)
+        self.date_font = _get_font(*self.date_font_key)
+        # Line pitch (font ascent + descent plus spacing) is fixed per font, so layout
+        # loops advance by a constant instead of measuring every line
+        self._title_lh = _font_line_height(self.title_font) + 10
+        self._content_lh = _font_line_height(self.content_font) + 15
+        from PIL import Image, ImageDraw
+        
+        # Reusable canvas and glyph masks (about 5 MB together), cleared in place per
+        # render instead of reallocated; the lock serializes renders that share them
+        size = (width, height)
+        self._canvas = Image.new('RGB', size, self.background_color)
+        self._accent_mask = Image.new('L', size, 0)
+        self._text_mask = Image.new('L', size, 0)
+        self._accent_draw = ImageDraw.Draw(self._accent_mask)
+        self._text_draw = ImageDraw.Draw(self._text_mask)
+        self._render_lock = threading.Lock()
+    
+    def create_quote_image(self, title: str, content: str, date: str = "", save_path: str = "temp_post.jpg") -> str:
+        """Create a quote image for Instagram/X and save it to save_path"""
+        image_data = self.render_quote_image(title, content, date)
+        with open(save_path, 'wb') as f:
+            f.write(image_data)
+        logger.info(f"Generated image saved to {save_path}")
+        return save_path
+    
+    def render_quote_image(self, title: str, content: str, date: str = "") -> bytes:
+        """Render a quote image for Instagram/X and return the encoded JPEG bytes
+        
+        Results are cached by text and layout, so retries and re-posts of the
+        same quote skip Pillow entirely.
+        """
+        # Truncate once; the cache key is exactly what gets drawn
+        if len(content) > 500:
+            content = content[:500] + "..."
+        key = (title, content, date, self.width, self.height,
+               self.background_color, self.text_color, self.accent_color)
+        with _QUOTE_IMAGE_CACHE_LOCK:
+            image_data = _QUOTE_IMAGE_CACHE.get(key)
+            if image_data is not None:
+                _QUOTE_IMAGE_CACHE.move_to_end(key)
+                return image_data
+        
+        # Render outside the cache lock so other quotes are not held up by this one
+        image_data = self._render_quote_image(title, content, date)
+        with _QUOTE_IMAGE_CACHE_LOCK:
+            _QUOTE_IMAGE_CACHE[key] = image_data
+            if len(_QUOTE_IMAGE_CACHE) > _QUOTE_IMAGE_CACHE_SIZE:
+                _QUOTE_IMAGE_CACHE.popitem(last=False)
+        return image_data
+    
+    def _render_quote_image(self, title: str, content: str, date: str) -> bytes:
+        """Draw and encode the quote image (content is expected to be truncated already)"""
+        with self._render_lock:
+            return self._render_quote_image_locked(title, content, date)
     
-    def create_quote_image(self, title: str, content: str, date: str = "", save_path: str = "temp_post.png") -> str:
-        """Create a quote image for Instagram/X"""
+    def _render_quote_image_locked(self, title: str, content: str, date: str) -> bytes:
         try:
-            # Create image
-            img = Image.new('RGB', (self.width, self.height), self.background_color)
-            draw = ImageDraw.Draw(img)
+            # Glyphs are rasterized into single-channel masks, one per text colour, and
+            # each colour is painted onto the RGB canvas once at the end (1/3 of the
+            # bytes touched per draw.text compared to drawing on RGB directly)
+            box = (0, 0, self.width, self.height)
+            accent_draw = self._accent_draw
+            text_draw = self._text_draw
+            accent_draw.rectangle(box, fill=0)
+            text_draw.rectangle(box, fill=0)
             
-            # Try to load a nice font, fallback to default
-            try:
-                title_font = ImageFont.truetype("arial.ttf", 48)
-                content_font = ImageFont.truetype("arial.ttf", 32)
-                date_font = ImageFont.truetype("arial.ttf", 24)
-            except:
-                title_font = ImageFont.load_default()
-                content_font = ImageFont.load_default()
-                date_font = ImageFont.load_default()
+            title_font = self.title_font
+            content_font = self.content_font
+            date_font = self.date_font
             
             # Calculate margins
             margin = 80
@@ -829,66 +1631,75 @@ class ImageGenerator:
             
             # Draw title
             title_y = margin
-            wrapped_title = self._wrap_text(title, title_font, max_width)
-            for line in wrapped_title:
-                bbox = draw.textbbox((0, 0), line, font=title_font)
-                line_width = bbox[2] - bbox[0]
-                x = (self.width - line_width) // 2
-                draw.text((x, title_y), line, font=title_font, fill=self.accent_color)
-                title_y += bbox[3] - bbox[1] + 10
+            # Line widths come from the wrap pass, so no line is shaped twice
+            wrapped_title = self._wrap_text(title, self.title_font_key, max_width)
+            for line, line_width in wrapped_title:
+                x = (self.width - int(line_width)) // 2
+                accent_draw.text((x, title_y), line, font=title_font, fill=255)
+                title_y += self._title_lh
             
             # Add some space after title
             content_y = title_y + 40
             
             # Draw content
-            wrapped_content = self._wrap_text(content[:500] + "..." if len(content) > 500 else content, 
-                                            content_font, max_width)
-            for line in wrapped_content:
+            wrapped_content = self._wrap_text(content, self.content_font_key, max_width)
+            for line, line_width in wrapped_content:
                 if content_y > self.height - 200:  # Leave space for date
                     break
-                bbox = draw.textbbox((0, 0), line, font=content_font)
-                line_width = bbox[2] - bbox[0]
-                x = (self.width - line_width) // 2
-                draw.text((x, content_y), line, font=content_font, fill=self.text_color)
-                content_y += bbox[3] - bbox[1] + 15
+                x = (self.width - int(line_width)) // 2
+                text_draw.text((x, content_y), line, font=content_font, fill=255)
+                content_y += self._content_lh
             
             # Draw date at bottom
             if date:
-                date_bbox = draw.textbbox((0, 0), date, font=date_font)
-                date_width = date_bbox[2] - date_bbox[0]
+                date_width = int(date_font.getlength(date))
                 date_x = (self.width - date_width) // 2
                 date_y = self.height - margin - 30
-                draw.text((date_x, date_y), date, font=date_font, fill=self.text_color)
+                text_draw.text((date_x, date_y), date, font=date_font, fill=255)
+            
+            # Composite: background, then each text colour through its mask
+            img = self._canvas
+            img.paste(self.background_color, box)
+            img.paste(self.accent_color, mask=self._accent_mask)
+            img.paste(self.text_color, mask=self._text_mask)
             
-            # Save image
-            img.save(save_path, 'PNG', quality=95)
-            logger.info(f"Generated image saved to {save_path}")
-            return save_path
+            # Encode in memory as JPEG: the card is opaque, X and Instagram re-encode
+            # to JPEG anyway, and it is far cheaper to encode and upload than PNG
+            buf = BytesIO()
+            img.save(buf, 'JPEG', quality=90, subsampling=2, optimize=False)
+            return buf.getvalue()
             
         except Exception as e:
             logger.error(f"Failed to generate image: {e}")
             raise
     
-    def _wrap_text(self, text: str, font, max_width: int) -> list:
-        """Wrap text to fit within max_width"""
-        words = text.split()
+    def _wrap_text(self, text: str, font_key: tuple, max_width: int) -> list:
+        """Wrap text to fit within max_width using the (path, size) font in font_key
+        
+        Returns (line, pixel width) pairs; the width is the running sum kept while
+        wrapping, which callers use for centering.
+        """
+        space_w = _word_advance(font_key, " ")
         lines = []
-        current_line = ""
+        # Words of the line being built and its running pixel width
+        current = []
+        current_w = 0.0
         
-        for word in words:
-            test_line = current_line + " " + word if current_line else word
-            bbox = font.getbbox(test_line)
-            if bbox[2] <= max_width:
-                current_line = test_line
+        for word in text.split():
+            word_w = _word_advance(font_key, word)
+            if current_w + (space_w if current else 0) + word_w <= max_width:
+                current_w += (space_w if current else 0) + word_w
+                current.append(word)
+            elif current:
+                lines.append((" ".join(current), current_w))
+                current = [word]
+                current_w = word_w
             else:
-                if current_line:
-                    lines.append(current_line)
-                    current_line = word
-                else:
-                    lines.append(word)
+                # A single word wider than the line gets a line of its own
+                lines.append((word, word_w))
         
-        if current_line:
-            lines.append(current_line)
+        if current:
+            lines.append((" ".join(current), current_w))
         
         return lines
 
@@ -900,6 +1711,7 @@ class SocialMediaManager:
         self.instagram_poster = None
         self.facebook_poster = None
         self.spotify_poster = None
+        self.rate_limiter = RateLimiter()
         self.image_generator = ImageGenerator()
         self.content_formatter = ContentFormatter()
         # Read voice from config.json if not explicitly provided
@@ -920,9 +1732,13 @@ class SocialMediaManager:
         """Setup Instagram posting"""
         self.instagram_poster = InstagramPoster(username, password)
     
-    def setup_facebook(self, page_access_token: str, page_id: str):
-        """Setup Facebook Page posting"""
-        self.facebook_poster = FacebookPoster(page_access_token, page_id)
+    def setup_facebook(self, page_access_token: str, page_id: str,
+                       app_id: Optional[str] = None, app_secret: Optional[str] = None,
+                       user_access_token: Optional[str] = None):
+        """Setup Facebook Page posting (app credentials plus a user token enable the
+        long-lived page token exchange)"""
+        self.facebook_poster = FacebookPoster(page_access_token, page_id, app_id, app_secret,
+                                              user_access_token)
     
     def setup_spotify_podcast(self, config_path: str = 'config.json'):
         """Setup automated Spotify Podcast posting via RSS feed
@@ -943,6 +1759,75 @@ class SocialMediaManager:
         self.audio_generator = AudioGenerator(voice=voice)
         logger.info(f"Changed audio voice to: {voice}")
     
+    @contextlib.asynccontextmanager
+    async def _http_session(self):
+        """aiohttp session for one broadcast() call (closed when it ends), or None
+        when aiohttp is not installed"""
+        try:
+            import aiohttp
+        except ImportError:
+            yield None
+            return
+        async with aiohttp.ClientSession() as session:
+            yield session
+    
+    # API host each platform's posts go to, as keyed in RateLimiter.limits
+    _PLATFORM_HOSTS = {
+        "X": 'api.twitter.com',
+        "Instagram": 'i.instagram.com',
+        "Facebook": 'graph.facebook.com',
+    }
+    
+    async def _rate_limited(self, host: str, coro):
+        """Await coro once the rate limiter grants a slot for host"""
+        async with self.rate_limiter.acquire(host):
+            return await coro
+    
+    async def broadcast(self, text: str, image_path: Optional[str] = None) -> list:
+        """Post the same text (and optional image) to every configured platform concurrently
+        
+        Total wall time is that of the slowest platform rather than the sum of all.
+        
+        Args:
+            text: Post text / caption
+            image_path: Optional image to attach (Instagram is skipped without one)
+            
+        Returns:
+            One result dict per platform, in X, Instagram, Facebook order
+        """
+        # Sessions are bound to their event loop, so each call gets its own
+        async with self._http_session() as session:
+            platforms = []
+            tasks = []
+        
+            if self.x_poster:
+                platforms.append("X")
+                if image_path:
+                    tasks.append(self.x_poster.post_with_image_async(text, image_path, session=session))
+                else:
+                    tasks.append(self.x_poster.post_text_async(text, session=session))
+        
+            if self.instagram_poster and image_path:
+                platforms.append("Instagram")
+                tasks.append(self.instagram_poster.post_image_with_caption_async(image_path, text))
+        
+            if self.facebook_poster:
+                platforms.append("Facebook")
+                if image_path:
+                    tasks.append(self.facebook_poster.post_photo_async(image_path, text, session=session))
+                else:
+                    tasks.append(self.facebook_poster.post_text_async(text, session=session))
+        
+            outcomes = await asyncio.gather(
+                *(self._rate_limited(self._PLATFORM_HOSTS[platform], task)
+                  for platform, task in zip(platforms, tasks)),
+                return_exceptions=True)
+            return [
+                {"platform": platform, "success": False, "error": str(outcome)}
+                if isinstance(outcome, BaseException) else outcome
+                for platform, outcome in zip(platforms, outcomes)
+            ]
+    
     def post_to_all_platforms(self, title: str, content: str, date: str = "", 
                              include_image: bool = True, include_audio: bool = False) -> list:
         """Post content to all configured platforms
@@ -956,87 +1841,116 @@ class SocialMediaManager:
         """
         results = []
         
-        # Generate image if needed
-        image_path = None
-        if include_image:
+        def render_image():
+            # Render the image once in memory; X and Facebook upload the bytes directly
             try:
-                image_path = self.image_generator.create_quote_image(title, content, date)
+                return self.image_generator.render_quote_image(title, content, date)
             except Exception as e:
                 logger.warning(f"Failed to generate image: {e}")
-                include_image = False
+                return None
         
-        # Generate audio if needed
-        audio_path = None
-        if include_audio:
+        def generate_audio():
             try:
                 episode_data = self.audio_generator.create_podcast_episode(title, content, date)
-                audio_path = episode_data['audio_path']
-                logger.info(f"Generated audio: {audio_path} ({episode_data['duration']:.1f}s)")
+                logger.info(f"Generated audio: {episode_data['audio_path']} ({episode_data['duration']:.1f}s)")
+                return episode_data['audio_path']
             except Exception as e:
                 logger.warning(f"Failed to generate audio: {e}")
-                include_audio = False
+                return None
         
-        # Post to X
-        if self.x_poster:
-            x_text = f"{title}\n\n{content[:200]}..." if len(content) > 200 else f"{title}\n\n{content}"
-            if include_image and image_path:
-                result = self.x_poster.post_with_image(x_text, image_path)
-            else:
-                result = self.x_poster.post_text(x_text)
-            results.append(result)
-        
-        # Post to Instagram
-        if self.instagram_poster and include_image and image_path:
-            instagram_formatted = self.content_formatter.format_for_platform(
-                title=title,
-                content=content,
-                platform='instagram',
-                date=date,
-                include_hashtags=True
-            )
-            instagram_caption = instagram_formatted['text']
-            result = self.instagram_poster.post_image_with_caption(image_path, instagram_caption)
-            results.append(result)
-        
-        # Post to Facebook
-        if self.facebook_poster:
-            if include_image and image_path:
-                facebook_formatted = self.content_formatter.format_for_platform(
+        # Image rendering and speech synthesis are independent: when both are needed
+        # they run side by side, so preparation takes as long as the slower of the two
+        image_data = audio_path = None
+        if include_image and include_audio:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                image_future = executor.submit(render_image)
+                audio_future = executor.submit(generate_audio)
+                image_data = image_future.result()
+                audio_path = audio_future.result()
+        elif include_image:
+            image_data = render_image()
+        elif include_audio:
+            audio_path = generate_audio()
+        
+        # Decide once what was actually produced; every platform branch keys off these
+        do_image = image_data is not None
+        do_audio = audio_path is not None
+        
+        with contextlib.ExitStack() as cleanup:
+            # instagrapi can only upload from a file path; the temp file is removed
+            # when this block exits, whatever happens while posting
+            image_path = None
+            if do_image and self.instagram_poster:
+                try:
+                    image_path = cleanup.enter_context(_temp_image_file(image_data, '.jpg'))
+                except OSError as e:
+                    logger.warning(f"Failed to write image for Instagram: {e}")
+            
+            # Every platform upload is an independent blocking call: collect them as
+            # jobs and run them concurrently, so wall time is the slowest platform's
+            jobs = []
+            
+            # Post to X
+            if self.x_poster:
+                # Fill X's full 280-character budget: whatever the title and its blank
+                # line leave is given to the content, trimmed with a single ellipsis
+                budget = 280 - len(title) - 2
+                x_body = content if len(content) <= budget else content[:max(budget - 1, 0)] + "…"
+                x_text = f"{title}\n\n{x_body}"
+                if do_image:
+                    jobs.append((self.x_poster.post_with_image, (x_text, 'quote.jpg', image_data)))
+                else:
+                    jobs.append((self.x_poster.post_text, (x_text,)))
+            
+            # Post to Instagram (image_path is only set when an Instagram poster exists)
+            if image_path:
+                instagram_formatted = self.content_formatter.format_for_platform(
                     title=title,
                     content=content,
-                    platform='facebook',
+                    platform='instagram',
                     date=date,
                     include_hashtags=True
                 )
-                result = self.facebook_poster.post_photo(image_path, facebook_formatted['text'])
-            else:
-                fb_text = f"{title}\n\n{content}"
-                result = self.facebook_poster.post_text(fb_text)
-            results.append(result)
-        
-        # Post to Spotify/Anchor via RSS feed
-        if self.spotify_poster and include_audio and audio_path:
-            podcast_description = self.content_formatter.format_for_platform(
-                title=title,
-                content=content,
-                platform='linkedin',  # Using LinkedIn format for cleaner description
-                date=date,
-                include_hashtags=False
-            )['text']
-            result = self.spotify_poster.publish_episode(audio_path, title, podcast_description)
-            results.append(result)
-        
-        # Clean up temporary image
-        if image_path and os.path.exists(image_path):
-            try:
-                os.remove(image_path)
-            except:
-                pass
+                instagram_caption = instagram_formatted['text']
+                jobs.append((self.instagram_poster.post_image_with_caption, (image_path, instagram_caption)))
+            
+            # Post to Facebook
+            if self.facebook_poster:
+                if do_image:
+                    facebook_formatted = self.content_formatter.format_for_platform(
+                        title=title,
+                        content=content,
+                        platform='facebook',
+                        date=date,
+                        include_hashtags=True
+                    )
+                    jobs.append((self.facebook_poster.post_photo, ('quote.jpg', facebook_formatted['text'], image_data)))
+                else:
+                    fb_text = f"{title}\n\n{content}"
+                    jobs.append((self.facebook_poster.post_text, (fb_text,)))
+            
+            # Post to Spotify/Anchor via RSS feed
+            if self.spotify_poster and do_audio:
+                podcast_description = self.content_formatter.format_for_platform(
+                    title=title,
+                    content=content,
+                    platform='linkedin',  # Using LinkedIn format for cleaner description
+                    date=date,
+                    include_hashtags=False
+                )['text']
+                jobs.append((self.spotify_poster.publish_episode, (audio_path, title, podcast_description)))
+            
+            if jobs:
+                with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                    futures = [executor.submit(fn, *args) for fn, args in jobs]
+                    # Results keep the X, Instagram, Facebook, Spotify order
+                    results.extend(future.result() for future in futures)
         
         return results
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     # This would normally be used with proper credentials
     manager = SocialMediaManager()
     
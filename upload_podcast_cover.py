@@ -1,8 +1,25 @@
 """Upload podcast cover art to Firebase Storage"""
-import firebase_admin
-from firebase_admin import credentials, storage
-import json
+import functools
+import mimetypes
 import os
+from urllib.parse import quote
+
+from google.auth.transport.requests import Request
+from google.oauth2 import service_account
+
+from http_session import make_session
+
+# A one-blob upload goes straight to the Cloud Storage JSON API over plain HTTPS:
+# no firebase_admin / google-cloud-storage import or client setup
+_SESSION = make_session()
+
+@functools.lru_cache(maxsize=1)
+def _credentials():
+    """Load the service account once; its project ID is also the bucket name"""
+    return service_account.Credentials.from_service_account_file(
+        'serviceAccountKey.json',
+        scopes=['https://www.googleapis.com/auth/devstorage.full_control']
+    )
 
 def upload_cover_art(cover_path: str):
     """Upload podcast cover to Firebase Storage
@@ -12,27 +29,24 @@ def upload_cover_art(cover_path: str):
     """
     print(f"📤 Uploading podcast cover: {cover_path}")
     
-    # Initialize Firebase
-    if not firebase_admin._apps:
-        cred = credentials.Certificate('serviceAccountKey.json')
-        
-        # Get project ID
-        with open('serviceAccountKey.json', 'r') as f:
-            cred_data = json.load(f)
-            project_id = cred_data.get('project_id')
-        
-        firebase_admin.initialize_app(cred, {
-            'storageBucket': project_id
-        })
-    
-    bucket = storage.bucket()
+    creds = _credentials()
+    if not creds.valid:
+        creds.refresh(Request(session=_SESSION))
+    bucket = creds.project_id
+    blob_name = 'podcast_cover.jpg'
     
-    # Upload cover art
-    blob = bucket.blob('podcast_cover.jpg')
-    blob.upload_from_filename(cover_path)
-    blob.make_public()
+    # Upload cover art, publicly readable (same effect as blob.make_public())
+    content_type = mimetypes.guess_type(cover_path)[0] or 'application/octet-stream'
+    with open(cover_path, 'rb') as f:
+        response = _SESSION.post(
+            f"https://storage.googleapis.com/upload/storage/v1/b/{bucket}/o",
+            params={'uploadType': 'media', 'name': blob_name, 'predefinedAcl': 'publicRead'},
+            data=f,
+            headers={'Authorization': f'Bearer {creds.token}', 'Content-Type': content_type}
+        )
+    response.raise_for_status()
     
-    public_url = blob.public_url
+    public_url = f"https://storage.googleapis.com/{bucket}/{quote(blob_name)}"
     print(f"✅ Cover uploaded!")
     print(f"🔗 Public URL: {public_url}")
     
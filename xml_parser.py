@@ -8,20 +8,38 @@ from datetime import datetime
 from typing import List, Dict, Optional
 import re
 
+# Marks a PizziniEntry whose date has not been parsed yet (None is a valid result)
+_UNPARSED = object()
+
 class PizziniEntry:
     """Represents a single pizzini entry"""
     
+    # No per-instance __dict__: archives hold thousands of entries
+    __slots__ = ('id', 'date', 'title', 'content', '_parsed_date')
+    
     def __init__(self, entry_id: int, date: str, title: str, content: str):
         self.id = entry_id
         self.date = date
         self.title = title
         self.content = content
-        self.parsed_date = self._parse_date(date)
+        self._parsed_date = _UNPARSED
+    
+    @property
+    def parsed_date(self) -> Optional[datetime]:
+        """The entry date as a datetime, parsed on first access (None if unparseable)"""
+        # Cached by hand: functools.cached_property needs an instance __dict__
+        if self._parsed_date is _UNPARSED:
+            self._parsed_date = self._parse_date(self.date)
+        return self._parsed_date
     
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse the date string from the XML format"""
         try:
-            # Handle the format "17.09.2012"
+            # Handle the format "17.09.2012": fixed-width dates are sliced directly,
+            # anything else (e.g. "1.9.2012") goes through strptime
+            if (len(date_str) == 10 and date_str[2] == date_str[5] == '.' and date_str.isascii()
+                    and (date_str[:2] + date_str[3:5] + date_str[6:]).isdigit()):
+                return datetime(int(date_str[6:10]), int(date_str[3:5]), int(date_str[0:2]))
             return datetime.strptime(date_str, "%d.%m.%Y")
         except (ValueError, TypeError):
             return None
@@ -57,22 +75,27 @@ class PizziniXMLParser:
     def parse(self) -> List[PizziniEntry]:
         """Parse the XML file and return a list of PizziniEntry objects"""
         try:
-            tree = ET.parse(self.xml_file_path)
-            root = tree.getroot()
-            
-            # Find all pizzini elements (skip schema)
-            pizzini_elements = root.findall('.//pizzini/pizzini')
-            if not pizzini_elements:
-                # Try alternative path structure
-                pizzini_elements = root.findall('.//pizzini')
-                # Filter out the schema element
-                pizzini_elements = [elem for elem in pizzini_elements if elem.find('Id') is not None]
-            
-            for pizzini_elem in pizzini_elements:
-                entry_id = self._get_element_text(pizzini_elem, 'Id', 0)
-                date = self._get_element_text(pizzini_elem, 'Date', '')
-                title = self._get_element_text(pizzini_elem, 'Title', '')
-                content = self._get_element_text(pizzini_elem, 'Content', '')
+            entries = []
+            # Stream the file: each <pizzini> is handled as soon as it closes and then
+            # cleared, so the full DOM is never built. Only elements with an Id child
+            # are entries (this skips the root and the schema's declarations)
+            for _, elem in ET.iterparse(self.xml_file_path, events=('end',)):
+                if elem.tag != 'pizzini':
+                    continue
+                
+                # One pass over the children instead of a find() per field; the first
+                # child with a given tag wins, as with find()
+                fields = {}
+                for child in elem:
+                    fields.setdefault(child.tag, child.text)
+                if 'Id' not in fields:
+                    continue
+                
+                entry_id = fields['Id'] or '0'
+                date = fields.get('Date') or ''
+                title = fields.get('Title') or ''
+                content = fields.get('Content') or ''
+                elem.clear()
                 
                 if title or content:  # Only add if we have meaningful content
                     entry = PizziniEntry(
@@ -81,8 +104,10 @@ class PizziniXMLParser:
                         title=title,
                         content=content
                     )
-                    self.entries.append(entry)
+                    entries.append(entry)
             
+            # Entries are only kept once the whole file parsed cleanly
+            self.entries.extend(entries)
             return self.entries
             
         except ET.ParseError as e:
@@ -92,11 +117,6 @@ class PizziniXMLParser:
             print(f"Unexpected error: {e}")
             return []
     
-    def _get_element_text(self, parent_elem, element_name: str, default='') -> str:
-        """Safely get text from an XML element"""
-        elem = parent_elem.find(element_name)
-        return elem.text if elem is not None and elem.text else str(default)
-    
     def get_entry_by_id(self, entry_id: int) -> Optional[PizziniEntry]:
         """Get a specific entry by its ID"""
         for entry in self.entries:
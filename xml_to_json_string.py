@@ -6,24 +6,41 @@ Usage:
 """
 import sys
 import json
+from pathlib import Path
 
-if len(sys.argv) not in (2, 3):
-    print("Usage: python xml_to_json_string.py <xml_file> [output_file]")
-    sys.exit(1)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-xml_path = sys.argv[1]
-output_path = sys.argv[2] if len(sys.argv) == 3 else None
+def main():
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python xml_to_json_string.py <xml_file> [output_file]")
+        sys.exit(1)
 
-with open(xml_path, 'r', encoding='utf-8') as f:
-    xml_content = f.read()
+    xml_path = sys.argv[1]
+    output_path = sys.argv[2] if len(sys.argv) == 3 else None
 
-# Use json.dumps to escape the string for JSON, but remove the surrounding quotes
-json_escaped = json.dumps(xml_content, ensure_ascii=False)
-json_escaped_value = json_escaped[1:-1]
+    data = Path(xml_path).read_bytes()
+    if b'\r' in data:
+        # Same newline translation as reading the file in text mode
+        data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    xml_content = data.decode('utf-8')
 
-if output_path:
-    with open(output_path, 'w', encoding='utf-8') as out:
-        out.write(json_escaped_value)
-    print(f"JSON-escaped XML content written to {output_path}")
-else:
-    print(json_escaped_value)
+    # Escape the string for JSON, but remove the surrounding quotes. orjson produces the
+    # same escapes as json.dumps(ensure_ascii=False) (UTF-8 kept as-is) in a single native pass
+    if orjson is not None:
+        json_escaped = orjson.dumps(xml_content)
+    else:
+        json_escaped = json.dumps(xml_content, ensure_ascii=False).encode('utf-8')
+    # A view drops the quotes without copying the (multi-MB) escaped bytes
+    json_escaped_value = memoryview(json_escaped)[1:-1]
+
+    if output_path:
+        Path(output_path).write_bytes(json_escaped_value)
+        print(f"JSON-escaped XML content written to {output_path}")
+    else:
+        print(str(json_escaped_value, 'utf-8'))
+
+if __name__ == '__main__':
+    main()